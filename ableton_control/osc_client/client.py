@@ -4,15 +4,213 @@ OSC Client for Ableton Live Communication
 
 import asyncio
 import logging
-from typing import Any, Optional, Dict, List, Callable
-from pythonosc.udp_client import SimpleUDPClient
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import BlockingOSCUDPServer
-import threading
-import time
+import socket
+import struct
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Optional, Dict, List, Callable, Union, Deque, DefaultDict, Sequence, Tuple
+from pythonosc.osc_message_builder import OscMessageBuilder
+from pythonosc.osc_packet import OscPacket, ParseError
+
+from .mmsg import create_receiver, create_sender
 
 logger = logging.getLogger(__name__)
 
+# Most datagrams written per flush; batching beyond this gains little
+_MAX_SEND_BATCH = 100
+
+# Size of the reusable encode buffers; larger messages use OscMessageBuilder
+_POOL_BUFFER_SIZE = 4096
+
+# Kernel socket buffer sizes; bursts of replies (get_notes, listeners) are
+# silently dropped once the default ~200 KB receive buffer fills up
+_RECV_BUFFER_SIZE = 4 * 1024 * 1024
+_SEND_BUFFER_SIZE = 1 * 1024 * 1024
+
+# Replies read per recvmmsg call, and the largest reply accepted (UDP max)
+_RECV_BATCH = 32
+_RECV_DATAGRAM_SIZE = 65536
+
+# Replies larger than this (get_notes, parameter dumps) are decoded on a
+# worker thread so they don't stall the event loop
+_INLINE_DECODE_LIMIT = 1024
+
+# How long a locally tracked track count is trusted; bounds staleness from
+# tracks added or removed by hand in Live
+_TRACK_COUNT_TTL = 5.0
+
+# Notes per /live/clip/add/notes message; keeps each datagram around 3 KB,
+# well below the 9 KB UDP datagram limit on macOS
+_NOTES_PER_MESSAGE = 128
+
+Datagram = Union[bytes, memoryview]
+
+
+def _build_dgram(address: str, *args) -> bytes:
+    """Encode an OSC message to its wire bytes."""
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+def _pack_string(buf: bytearray, offset: int, value: str) -> int:
+    """Write a null-terminated, 4-byte padded OSC string and return the new offset."""
+    data = value.encode("utf-8")
+    size = (len(data) + 4) & ~3
+    struct.pack_into(f"{size}s", buf, offset, data)
+    return offset + size
+
+
+def _encode_into(buf: bytearray, address: str, args: tuple) -> int:
+    """
+    Encode an OSC message directly into ``buf``.
+    
+    Returns:
+        Number of bytes written
+        
+    Raises:
+        TypeError: An argument type is not handled by the fast path
+        struct.error: The message does not fit in ``buf``
+    """
+    tags = [","]
+    for arg in args:
+        if arg is True:
+            tags.append("T")
+        elif arg is False:
+            tags.append("F")
+        elif arg is None:
+            tags.append("N")
+        elif isinstance(arg, int):
+            tags.append("i" if -0x80000000 <= arg <= 0x7FFFFFFF else "h")
+        elif isinstance(arg, float):
+            tags.append("f")
+        elif isinstance(arg, str):
+            tags.append("s")
+        elif isinstance(arg, (bytes, bytearray)):
+            tags.append("b")
+        else:
+            raise TypeError(f"Unsupported OSC argument type: {type(arg).__name__}")
+    
+    offset = _pack_string(buf, 0, address)
+    offset = _pack_string(buf, offset, "".join(tags))
+    for tag, arg in zip(tags[1:], args):
+        if tag == "i":
+            struct.pack_into(">i", buf, offset, arg)
+            offset += 4
+        elif tag == "f":
+            struct.pack_into(">f", buf, offset, arg)
+            offset += 4
+        elif tag == "s":
+            offset = _pack_string(buf, offset, arg)
+        elif tag == "h":
+            struct.pack_into(">q", buf, offset, arg)
+            offset += 8
+        elif tag == "b":
+            size = (len(arg) + 3) & ~3
+            struct.pack_into(f">i{size}s", buf, offset, len(arg), arg)
+            offset += 4 + size
+    return offset
+
+
+# Fire-and-forget messages without arguments, encoded once at import
+_CONST_DGRAMS = {
+    address: _build_dgram(address)
+    for address in (
+        "/live/song/start_playing",
+        "/live/song/stop_playing",
+        "/live/song/undo",
+        "/live/song/redo",
+        "/live/song/create_return_track",
+        "/live/song/create_scene",
+        "/live/song/start_listen/beat",
+        "/live/song/stop_listen/beat",
+    )
+}
+
+
+def _fixed_signature(address: str, tags: str):
+    """
+    Precompile a message whose argument types never change.
+    
+    Args:
+        address: OSC address
+        tags: OSC type tags of the arguments (only "i" and "f")
+        
+    Returns:
+        (encoded address and type tag header, struct.Struct for the arguments)
+    """
+    packer = struct.Struct(">" + tags)
+    placeholders = [0 if tag == "i" else 0.0 for tag in tags]
+    return _build_dgram(address, *placeholders)[:-packer.size], packer
+
+
+# Hot numeric setters: a precompiled header plus one struct.pack per call
+_PACKED_MESSAGES = {
+    address: _fixed_signature(address, tags)
+    for address, tags in (
+        ("/live/song/set/tempo", "f"),
+        ("/live/song/set/current_song_time", "f"),
+        ("/live/device/set/parameter/value", "iiif"),
+        ("/live/track/set/volume", "if"),
+        ("/live/track/set/panning", "if"),
+        ("/live/clip/set/gain", "iif"),
+        ("/live/clip/add/notes", "iiiffii"),
+    )
+}
+
+def _decode_packet(data: bytes) -> List[tuple]:
+    """Decode a datagram into (address, params) pairs; malformed ones yield none."""
+    try:
+        packet = OscPacket(data)
+    except ParseError as e:
+        logger.warning(f"⚠️ Dropping malformed OSC datagram: {e}")
+        return []
+    return [(msg.message.address, msg.message.params) for msg in packet.messages]
+
+
+class _OSCProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that decodes OSC packets straight into a callback."""
+    
+    def __init__(self, on_message: Callable[..., None], executor: Optional[ThreadPoolExecutor] = None):
+        """
+        Args:
+            on_message: Called as on_message(address, *args) for each message
+            executor: Pool for decoding large datagrams (None decodes inline)
+        """
+        self._on_message = on_message
+        self._executor = executor
+        # Decodes not yet dispatched, in arrival order
+        self._pending: Deque[asyncio.Future] = deque()
+    
+    def datagram_received(self, data: bytes, addr):
+        if self._executor is None or (len(data) <= _INLINE_DECODE_LIMIT and not self._pending):
+            self._dispatch(_decode_packet(data))
+            return
+        
+        # Queue behind outstanding decodes so replies keep their order
+        loop = asyncio.get_running_loop()
+        if len(data) > _INLINE_DECODE_LIMIT:
+            fut = loop.run_in_executor(self._executor, _decode_packet, data)
+        else:
+            fut = loop.create_future()
+            fut.set_result(_decode_packet(data))
+        self._pending.append(fut)
+        fut.add_done_callback(self._dispatch_ready)
+    
+    def _dispatch_ready(self, _fut: asyncio.Future):
+        """Dispatch every finished decode at the head of the queue."""
+        while self._pending and self._pending[0].done():
+            fut = self._pending.popleft()
+            if not fut.cancelled() and fut.exception() is None:
+                self._dispatch(fut.result())
+    
+    def _dispatch(self, messages: List[tuple]):
+        for address, params in messages:
+            self._on_message(address, *params)
+
+
 class AbletonOSCClient:
     """OSC client for communicating with Ableton Live via AbletonOSC."""
     
@@ -29,31 +227,77 @@ class AbletonOSCClient:
         self.send_port = send_port
         self.receive_port = receive_port
         
-        # OSC client for sending messages
-        self.client = SimpleUDPClient(host, send_port)
+        # Destination resolved once so sendto never does a name lookup
+        try:
+            self._addr = (socket.gethostbyname(host), send_port)
+        except OSError:
+            self._addr = (host, send_port)
+        
+        # One UDP socket for both directions: sends are drained in batches
+        # by _flush_loop, replies arrive through the endpoint bound in connect()
+        self._sock: Optional[socket.socket] = None
+        self._mmsg = None
+        self._open_socket()
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        # Encode buffers, reused once their datagram has been written
+        self._buf_pool: List[bytearray] = []
         
-        # OSC server for receiving messages
-        self.dispatcher = Dispatcher()
-        self.server = None
-        self.server_thread = None
+        # Datagram endpoint for receiving messages, or the loop polling the
+        # socket for recvmmsg batches where that is supported
+        self.transport: Optional[asyncio.DatagramTransport] = None
+        self.protocol: Optional[asyncio.DatagramProtocol] = None
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._decode_executor: Optional[ThreadPoolExecutor] = None
         
         # Response handling
         self.response_handlers: Dict[str, Callable] = {}
-        self.pending_responses: Dict[str, Any] = {}
+        # Futures awaiting a response, FIFO per address. A response nobody is
+        # waiting for (a late reply to a timed-out query, a listener event)
+        # goes only to response_handlers and is otherwise discarded
+        self._waiters: DefaultDict[str, Deque[asyncio.Future]] = defaultdict(deque)
+        
+        # Track count kept up to date across our own track creation, and the
+        # loop time it expires at
+        self._track_count: Optional[int] = None
+        self._track_count_expiry = 0.0
+        # Serializes track creation so concurrent creates name the right index
+        self._create_lock: Optional[asyncio.Lock] = None
         
-        self._setup_handlers()
+    @staticmethod
+    def run(coro):
+        """
+        Run a coroutine to completion, on uvloop when it is installed.
         
-    def _setup_handlers(self):
-        """Set up default OSC message handlers."""
-        # General response handler
-        self.dispatcher.map("/live/*", self._handle_live_response)
+        Args:
+            coro: Coroutine to run (e.g. a script's main())
+            
+        Returns:
+            The coroutine's result
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return asyncio.run(coro)
+        loop = uvloop.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
         
     def _handle_live_response(self, address: str, *args):
         """Handle incoming OSC messages from Ableton Live."""
-        logger.debug(f"Received OSC: {address} {args}")
+        if not address.startswith("/live/"):
+            return
+        logger.debug("Received OSC: %s %s", address, args)
         
-        # Store response for pending requests
-        self.pending_responses[address] = args
+        # Hand the response to the oldest live waiter, if any
+        waiters = self._waiters.get(address)
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(args)
+                break
         
         # Call custom handlers if registered
         if address in self.response_handlers:
@@ -67,11 +311,36 @@ class AbletonOSCClient:
             True if connection successful, False otherwise
         """
         try:
-            # Start OSC server for receiving messages
-            self.server = BlockingOSCUDPServer((self.host, self.receive_port), self.dispatcher)
-            self.server_thread = threading.Thread(target=self.server.serve_forever)
-            self.server_thread.daemon = True
-            self.server_thread.start()
+            # Start the writer task that coalesces outgoing messages
+            if self._flush_task is None:
+                self._send_queue = asyncio.Queue()
+                self._flush_task = asyncio.create_task(self._flush_loop())
+            
+            # Stop receiving on the socket of an earlier attempt first, so its
+            # reader is not left registered for an fd the new socket reuses
+            closing = self.transport is not None
+            self._stop_receiving()
+            if closing:
+                # The transport closes its socket on the next loop iteration
+                await asyncio.sleep(0)
+            
+            # Bind a fresh socket to the reply port and receive on it from the
+            # running event loop; sends go out of the same socket
+            self._open_socket()
+            self._sock.bind((self.host, self.receive_port))
+            loop = asyncio.get_running_loop()
+            if self._decode_executor is None:
+                self._decode_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="osc-decode")
+            receiver = create_receiver(self._sock, _RECV_BATCH, _RECV_DATAGRAM_SIZE)
+            if receiver is not None:
+                # Drain listener bursts with one recvmmsg call per wakeup
+                self.protocol = _OSCProtocol(self._handle_live_response, self._decode_executor)
+                loop.add_reader(self._sock.fileno(), self._drain, receiver)
+                self._reader_loop = loop
+            else:
+                self.transport, self.protocol = await loop.create_datagram_endpoint(
+                    lambda: _OSCProtocol(self._handle_live_response, self._decode_executor), sock=self._sock
+                )
             
             logger.info(f"OSC server listening on {self.host}:{self.receive_port}")
             
@@ -88,12 +357,69 @@ class AbletonOSCClient:
             logger.error(f"Failed to start OSC client: {e}")
             return False
     
+    def _drain(self, receiver):
+        """Read every pending reply in batches and dispatch it."""
+        while True:
+            try:
+                dgrams = receiver.recv()
+            except OSError as e:
+                logger.error(f"Failed to receive OSC datagrams: {e}")
+                return
+            for data in dgrams:
+                self.protocol.datagram_received(data, None)
+            if len(dgrams) < receiver.max_batch:
+                return
+    
+    def _open_socket(self):
+        """Replace the UDP socket (and its sendmmsg sender) with a new one."""
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._set_buffer_size(self._sock, socket.SO_SNDBUF, _SEND_BUFFER_SIZE)
+        self._set_buffer_size(self._sock, socket.SO_RCVBUF, _RECV_BUFFER_SIZE)
+        self._mmsg = create_sender(self._sock, self._addr, _MAX_SEND_BATCH)
+    
+    def _stop_receiving(self):
+        """Unregister the reply reader, or close the datagram endpoint (and its socket)."""
+        if self._reader_loop:
+            self._reader_loop.remove_reader(self._sock.fileno())
+            self._reader_loop = None
+            self.protocol = None
+        if self.transport:
+            # Closing the transport closes the shared socket
+            self.transport.close()
+            self.transport = None
+            self.protocol = None
+            self._sock = None
+    
+    @staticmethod
+    def _set_buffer_size(sock, option: int, size: int):
+        """Enlarge a socket buffer; the OS may cap it (e.g. net.core.rmem_max)."""
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, size)
+        except (OSError, AttributeError) as e:
+            logger.warning(f"⚠️ Could not set socket buffer size to {size}: {e}")
+    
     def disconnect(self):
         """Disconnect from Ableton Live."""
-        if self.server:
-            self.server.shutdown()
-        if self.server_thread:
-            self.server_thread.join(timeout=1.0)
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+            # Write out anything queued since the last flush
+            pending = []
+            while not self._send_queue.empty():
+                pending.append(self._send_queue.get_nowait())
+            self._send_queue = None
+            self._write_batch(pending)
+        if self._reader_loop or self.transport:
+            self._stop_receiving()
+            # Keep an unbound socket around so fire-and-forget sends still work
+            self._open_socket()
+        if self._decode_executor:
+            self._decode_executor.shutdown(wait=False)
+            self._decode_executor = None
+        self._invalidate_track_count()
         logger.info("Disconnected from Ableton Live")
     
     def send(self, address: str, *args):
@@ -105,11 +431,96 @@ class AbletonOSCClient:
             *args: Arguments to send with the message
         """
         try:
-            self.client.send_message(address, args if len(args) > 1 else (args[0] if args else []))
-            logger.debug(f"Sent OSC: {address} {args}")
+            buf = self._acquire_buffer()
+            try:
+                dgram = memoryview(buf)[:_encode_into(buf, address, args)]
+            except (TypeError, struct.error):
+                # Exotic argument types or oversized messages
+                self._buf_pool.append(buf)
+                dgram = _build_dgram(address, *args)
+            self._send_dgram(dgram)
+            logger.debug("Sent OSC: %s %s", address, args)
+        except Exception as e:
+            logger.error(f"Failed to send OSC message {address}: {e}")
+    
+    def _send_const(self, address: str):
+        """Send a precompiled argument-less message."""
+        try:
+            self._send_dgram(_CONST_DGRAMS[address])
+            logger.debug("Sent OSC: %s", address)
         except Exception as e:
             logger.error(f"Failed to send OSC message {address}: {e}")
     
+    def _send_packed(self, address: str, *args):
+        """Send a fixed-signature message from its precompiled header and struct."""
+        header, packer = _PACKED_MESSAGES[address]
+        size = len(header)
+        buf = self._acquire_buffer()
+        try:
+            buf[:size] = header
+            packer.pack_into(buf, size, *args)
+        except struct.error:
+            # An argument doesn't match the signature (e.g. a float pitch)
+            self._buf_pool.append(buf)
+            self.send(address, *args)
+            return
+        try:
+            self._send_dgram(memoryview(buf)[:size + packer.size])
+            logger.debug("Sent OSC: %s %s", address, args)
+        except Exception as e:
+            logger.error(f"Failed to send OSC message {address}: {e}")
+    
+    def _acquire_buffer(self) -> bytearray:
+        """Take an encode buffer from the pool, allocating one if it is empty."""
+        return self._buf_pool.pop() if self._buf_pool else bytearray(_POOL_BUFFER_SIZE)
+    
+    def _release_buffer(self, dgram: Datagram):
+        """Return the pooled buffer behind a written datagram."""
+        if isinstance(dgram, memoryview):
+            buf = dgram.obj
+            dgram.release()
+            if len(self._buf_pool) < _MAX_SEND_BATCH:
+                self._buf_pool.append(buf)
+    
+    def _send_dgram(self, dgram: Datagram):
+        """Queue an encoded datagram for the writer task, or write it directly."""
+        if self._send_queue is not None:
+            self._send_queue.put_nowait(dgram)
+        else:
+            try:
+                self._sock.sendto(dgram, self._addr)
+            finally:
+                self._release_buffer(dgram)
+    
+    async def _flush_loop(self):
+        """Drain the send queue, writing each burst of messages together."""
+        queue = self._send_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _MAX_SEND_BATCH:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            self._write_batch(batch)
+    
+    def _write_batch(self, batch: List[Datagram]):
+        """Write datagrams with one sendmmsg call where supported, else one sendto each."""
+        sent = 0
+        if self._mmsg and len(batch) > 1:
+            while sent < len(batch):
+                n = self._mmsg.send(batch[sent:sent + _MAX_SEND_BATCH])
+                if n == 0:
+                    break
+                sent += n
+        for dgram in batch[sent:]:
+            try:
+                self._sock.sendto(dgram, self._addr)
+            except OSError as e:
+                logger.error(f"Failed to send OSC datagram: {e}")
+        for dgram in batch:
+            self._release_buffer(dgram)
+    
     async def send_and_wait(self, address: str, response_address: str, *args, timeout: float = 2.0) -> Optional[Any]:
         """
         Send an OSC message and wait for a response.
@@ -123,35 +534,69 @@ class AbletonOSCClient:
         Returns:
             Response data or None if timeout
         """
-        # Clear any existing response
-        self.pending_responses.pop(response_address, None)
-        
         # Send the message
         self.send(address, *args)
         
         # Wait for response
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if response_address in self.pending_responses:
-                response = self.pending_responses.pop(response_address)
-                return response
-            await asyncio.sleep(0.01)  # Small delay to prevent busy waiting
+        try:
+            return await self._wait_response(response_address, timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Timeout waiting for response to {address}")
+            return None
+    
+    async def gather_queries(self, specs, timeout: float = 2.0) -> List[Optional[Any]]:
+        """
+        Send several queries back-to-back and await all their responses together.
         
-        logger.warning(f"Timeout waiting for response to {address}")
-        return None
+        All requests are written before any response is awaited, so the total
+        wait is roughly one round-trip rather than one per query. Responses on
+        the same address are matched to requests in send order.
+        
+        Args:
+            specs: Iterable of (address, response_address, *args) tuples
+            timeout: Timeout in seconds for each response
+            
+        Returns:
+            Response data per spec, in order (None for any that timed out)
+        """
+        return list(await asyncio.gather(*(
+            self.send_and_wait(address, response_address, *args, timeout=timeout)
+            for address, response_address, *args in specs
+        )))
+    
+    async def _wait_response(self, address: str, timeout: float) -> tuple:
+        """
+        Wait for the next response on an address, in FIFO order with other waiters.
+        
+        Only responses arriving after this call are matched; call it before
+        yielding to the event loop after sending the request.
+        
+        Raises:
+            asyncio.TimeoutError: No response arrived within timeout
+        """
+        fut = asyncio.get_running_loop().create_future()
+        waiters = self._waiters[address]
+        waiters.append(fut)
+        try:
+            return await asyncio.wait_for(fut, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            # Don't leave the dead waiter queued ahead of later requests
+            if fut in waiters:
+                waiters.remove(fut)
+            raise
     
     # Transport Control Methods
     async def play(self):
         """Start playback."""
-        self.send("/live/song/start_playing")
+        self._send_const("/live/song/start_playing")
         
     async def stop(self):
         """Stop playback."""  
-        self.send("/live/song/stop_playing")
+        self._send_const("/live/song/stop_playing")
         
     async def set_tempo(self, bpm: float):
         """Set the tempo."""
-        self.send("/live/song/set/tempo", bpm)
+        self._send_packed("/live/song/set/tempo", bpm)
         
     async def get_tempo(self) -> Optional[float]:
         """Get the current tempo."""
@@ -172,28 +617,44 @@ class AbletonOSCClient:
     # Track Management Methods
     async def create_audio_track(self, name: Optional[str] = None):
         """Create a new audio track."""
-        # Get current track count to know the index of the new track
-        track_count = await self.get_track_count() or 0
-        self.send("/live/song/create_audio_track", -1)  # -1 means end of list
-        if name:
-            await asyncio.sleep(0.2)  # Longer delay for track creation
-            self.send("/live/track/set/name", track_count, name)
+        await self._create_track("/live/song/create_audio_track", name)
     
     async def create_midi_track(self, name: Optional[str] = None):
         """Create a new MIDI track."""
-        # Get current track count to know the index of the new track
-        track_count = await self.get_track_count() or 0
-        self.send("/live/song/create_midi_track", -1)  # -1 means end of list
-        if name:
-            await asyncio.sleep(0.2)  # Longer delay for track creation
-            self.send("/live/track/set/name", track_count, name)
+        await self._create_track("/live/song/create_midi_track", name)
+    
+    async def _create_track(self, address: str, name: Optional[str]):
+        """
+        Append a track and name it once Live has created it.
+        
+        AbletonOSC handles messages in arrival order, so the track count
+        queried right after the create already includes the new track and
+        its reply doubles as the completion signal (no fixed sleep needed).
+        A recently cached count is simply incremented instead; an expired
+        one is dropped so the next lookup asks Live.
+        """
+        if self._create_lock is None:
+            self._create_lock = asyncio.Lock()
+        async with self._create_lock:
+            self.send(address, -1)  # -1 means end of list
+            if self._track_count is not None:
+                if asyncio.get_running_loop().time() < self._track_count_expiry:
+                    self._cache_track_count(self._track_count + 1)
+                else:
+                    self._invalidate_track_count()
+            if name:
+                track_count = await self._track_count_cached()
+                if track_count:
+                    self.send("/live/track/set/name", track_count - 1, name)
     
     async def create_return_track(self, name: Optional[str] = None):
         """Create a new return track."""
-        self.send("/live/song/create_return_track")
+        # AbletonOSC handles messages in order, so the rename lands on the new
+        # track; the ping reply confirms Live has processed both
+        self._send_const("/live/song/create_return_track")
         if name:
-            await asyncio.sleep(0.1)
             self.send("/live/return_track/set/name", -1, name)
+        await self.ping()
     
     # Clip Management Methods
     async def create_clip(self, track_idx: int, clip_slot_idx: int, length: float = 4.0):
@@ -241,14 +702,14 @@ class AbletonOSCClient:
             parameter_idx: Parameter index on the device
             value: Parameter value (0.0 - 1.0)
         """
-        self.send("/live/device/set/parameter/value", track_idx, device_idx, parameter_idx, value)
+        self._send_packed("/live/device/set/parameter/value", track_idx, device_idx, parameter_idx, value)
     
     # Project Management
     async def new_live_set(self):
         """Create a new Live set."""
         # Note: This command may not be available in AbletonOSC
         # Using song-level command instead
-        self.send("/live/song/create_scene")  # Create a new scene as fallback
+        self._send_const("/live/song/create_scene")  # Create a new scene as fallback
     
     async def save_live_set(self):
         """Save the current Live set."""
@@ -262,7 +723,25 @@ class AbletonOSCClient:
             "/live/song/get/num_tracks",
             "/live/song/get/num_tracks"
         )
-        return response[0] if response else None
+        if not response:
+            return None
+        self._cache_track_count(response[0])
+        return response[0]
+    
+    async def _track_count_cached(self) -> Optional[int]:
+        """Get the track count, skipping the round-trip while the cache is fresh."""
+        if self._track_count is not None and asyncio.get_running_loop().time() < self._track_count_expiry:
+            return self._track_count
+        return await self.get_track_count()
+    
+    def _cache_track_count(self, count: int):
+        """Remember the track count for the next _TRACK_COUNT_TTL seconds."""
+        self._track_count = count
+        self._track_count_expiry = asyncio.get_running_loop().time() + _TRACK_COUNT_TTL
+    
+    def _invalidate_track_count(self):
+        """Forget the cached track count after an operation that may change it."""
+        self._track_count = None
     
     async def get_live_version(self) -> Optional[str]:
         """Get Ableton Live version - basic connectivity test."""
@@ -290,7 +769,26 @@ class AbletonOSCClient:
     async def add_notes(self, track_idx: int, clip_idx: int, pitch: int, start_time: float, 
                        duration: float, velocity: int, mute: bool = False):
         """Add notes to a MIDI clip."""
-        self.send("/live/clip/add/notes", track_idx, clip_idx, pitch, start_time, duration, velocity, int(mute))
+        self._send_packed("/live/clip/add/notes", track_idx, clip_idx, pitch, start_time, duration, velocity, int(mute))
+    
+    async def add_notes_batch(self, track_idx: int, clip_idx: int,
+                              notes: Sequence[Tuple[int, float, float, int, bool]]):
+        """
+        Add many notes to a MIDI clip using as few OSC messages as possible.
+        
+        Args:
+            track_idx: Track index
+            clip_idx: Clip index
+            notes: (pitch, start_time, duration, velocity, mute) tuples
+        """
+        for i in range(0, len(notes), _NOTES_PER_MESSAGE):
+            self.send(
+                "/live/clip/add/notes", track_idx, clip_idx,
+                *chain.from_iterable(
+                    (pitch, start_time, duration, velocity, int(mute))
+                    for pitch, start_time, duration, velocity, mute in notes[i:i + _NOTES_PER_MESSAGE]
+                )
+            )
     
     async def remove_notes(self, track_idx: int, clip_idx: int, pitch: int, start_time: float, duration: float):
         """Remove notes from a MIDI clip."""
@@ -340,7 +838,7 @@ class AbletonOSCClient:
     
     async def set_clip_gain(self, track_idx: int, clip_idx: int, gain: float):
         """Set clip gain level."""
-        self.send("/live/clip/set/gain", track_idx, clip_idx, gain)
+        self._send_packed("/live/clip/set/gain", track_idx, clip_idx, gain)
     
     # Advanced Device Operations
     async def get_device_name(self, track_idx: int, device_idx: int):
@@ -386,7 +884,7 @@ class AbletonOSCClient:
     
     async def set_track_volume(self, track_idx: int, volume: float):
         """Set track volume (0.0-1.0)."""
-        self.send("/live/track/set/volume", track_idx, volume)
+        self._send_packed("/live/track/set/volume", track_idx, volume)
     
     async def get_track_volume(self, track_idx: int):
         """Get track volume."""
@@ -406,7 +904,7 @@ class AbletonOSCClient:
     
     async def set_track_panning(self, track_idx: int, pan: float):
         """Set track panning (-1.0 to 1.0)."""
-        self.send("/live/track/set/panning", track_idx, pan)
+        self._send_packed("/live/track/set/panning", track_idx, pan)
     
     async def stop_track_clips(self, track_idx: int):
         """Stop all clips on a track."""
@@ -422,7 +920,7 @@ class AbletonOSCClient:
         if index is not None:
             self.send("/live/song/create_scene", index)
         else:
-            self.send("/live/song/create_scene")
+            self._send_const("/live/song/create_scene")
     
     async def delete_scene(self, scene_idx: int):
         """Delete a scene."""
@@ -443,7 +941,7 @@ class AbletonOSCClient:
     
     async def set_current_song_time(self, time: float):
         """Set playback position."""
-        self.send("/live/song/set/current_song_time", time)
+        self._send_packed("/live/song/set/current_song_time", time)
     
     async def get_song_name(self):
         """Get song/project name."""
@@ -451,11 +949,13 @@ class AbletonOSCClient:
     
     async def undo(self):
         """Undo last action."""
-        self.send("/live/song/undo")
+        self._invalidate_track_count()
+        self._send_const("/live/song/undo")
     
     async def redo(self):
         """Redo last undone action."""
-        self.send("/live/song/redo")
+        self._invalidate_track_count()
+        self._send_const("/live/song/redo")
     
     # Audio Clip Operations
     async def set_warp_mode(self, track_idx: int, clip_idx: int, warp_mode: str):
@@ -481,11 +981,11 @@ class AbletonOSCClient:
     # Real-time Listening
     async def start_listen_beat(self):
         """Start listening for beat events."""
-        self.send("/live/song/start_listen/beat")
+        self._send_const("/live/song/start_listen/beat")
     
     async def stop_listen_beat(self):
         """Stop listening for beat events."""
-        self.send("/live/song/stop_listen/beat")
+        self._send_const("/live/song/stop_listen/beat")
     
     async def start_listen_playing_position(self, track_idx: int, clip_idx: int):
         """Start listening for clip playing position."""
@@ -504,6 +1004,28 @@ class AbletonOSCClient:
             start_track, num_tracks, *properties
         )
     
+    async def snapshot_tracks(self, properties: Sequence[str] = ("name", "mute", "solo")) -> List[Dict[str, Any]]:
+        """
+        Read properties of every track with one track_data query.
+        
+        Takes two round-trips: the track count is asked from Live (never
+        taken from the cache, which may be stale), then track_data.
+        
+        Args:
+            properties: Track attribute names (without the "track." prefix)
+            
+        Returns:
+            One dict per track mapping each property to its value
+        """
+        count = await self.get_track_count()
+        if not count:
+            return []
+        response = await self.get_track_data(0, count, [f"track.{prop}" for prop in properties])
+        if not response:
+            return []
+        width = len(properties)
+        return [dict(zip(properties, response[i:i + width])) for i in range(0, len(response), width)]
+    
     async def get_track_names(self):
         """Get all track names."""
         return await self.send_and_wait("/live/song/get/track_names", "/live/song/get/track_names")
\ No newline at end of file
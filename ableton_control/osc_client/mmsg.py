@@ -0,0 +1,181 @@
+"""
+Batched UDP syscalls for the OSC client.
+
+On Linux, sendmmsg(2) writes and recvmmsg(2) reads many datagrams with a
+single kernel entry. Other platforms get ``None`` from the factories and
+callers fall back to one ``sendto``/``recvfrom`` per datagram.
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import socket
+import struct
+import sys
+from typing import List, Optional, Sequence, Tuple, Union
+
+Datagram = Union[bytes, bytearray, memoryview]
+
+_MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0x40)
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [
+        ("iov_base", ctypes.c_void_p),
+        ("iov_len", ctypes.c_size_t),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IOVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_hdr", _MsgHdr),
+        ("msg_len", ctypes.c_uint),
+    ]
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load libc on Linux, or return None where mmsg calls are unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "sendmmsg") else None
+
+
+_libc = _load_libc()
+
+
+def _buffer_address(buf: Datagram) -> Tuple[object, int]:
+    """Return (keepalive, address) for the contents of a bytes-like datagram."""
+    if isinstance(buf, bytes):
+        ptr = ctypes.c_char_p(buf)
+        return ptr, ctypes.cast(ptr, ctypes.c_void_p).value
+    array = (ctypes.c_char * len(buf)).from_buffer(buf)
+    return array, ctypes.addressof(array)
+
+
+class MMsgSender:
+    """Send a batch of datagrams to one IPv4 destination with sendmmsg(2)."""
+
+    def __init__(self, sock: socket.socket, dest: Tuple[str, int], max_batch: int):
+        """
+        Args:
+            sock: Bound UDP socket to write on
+            dest: (host, port) every datagram is sent to
+            max_batch: Largest number of datagrams passed in one call
+        """
+        self._fd = sock.fileno()
+        self.max_batch = max_batch
+
+        host, port = dest
+        sockaddr = (
+            struct.pack("=H", socket.AF_INET)
+            + struct.pack("!H", port)
+            + socket.inet_aton(socket.gethostbyname(host))
+            + bytes(8)
+        )
+        self._sockaddr = ctypes.create_string_buffer(sockaddr, len(sockaddr))
+
+        self._iov = (_IOVec * max_batch)()
+        self._msgs = (_MMsgHdr * max_batch)()
+        for i in range(max_batch):
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_name = ctypes.cast(self._sockaddr, ctypes.c_void_p)
+            hdr.msg_namelen = len(sockaddr)
+            hdr.msg_iov = ctypes.pointer(self._iov[i])
+            hdr.msg_iovlen = 1
+
+    def send(self, dgrams: Sequence[Datagram]) -> int:
+        """
+        Send up to ``max_batch`` datagrams in one syscall.
+
+        Returns:
+            Number of datagrams the kernel accepted (0 on error)
+        """
+        count = min(len(dgrams), self.max_batch)
+        keepalive: List[object] = []
+        for i in range(count):
+            ref, addr = _buffer_address(dgrams[i])
+            keepalive.append(ref)
+            self._iov[i].iov_base = addr
+            self._iov[i].iov_len = len(dgrams[i])
+        sent = _libc.sendmmsg(self._fd, self._msgs, count, 0)
+        del keepalive
+        return max(sent, 0)
+
+
+class MMsgReceiver:
+    """Read a batch of pending datagrams from a socket with recvmmsg(2)."""
+
+    def __init__(self, sock: socket.socket, max_batch: int, datagram_size: int):
+        """
+        Args:
+            sock: Bound, non-blocking UDP socket to read from
+            max_batch: Largest number of datagrams read in one call
+            datagram_size: Receive buffer size per datagram
+        """
+        self._fd = sock.fileno()
+        self.max_batch = max_batch
+
+        self._bufs = [ctypes.create_string_buffer(datagram_size) for _ in range(max_batch)]
+        self._iov = (_IOVec * max_batch)()
+        self._msgs = (_MMsgHdr * max_batch)()
+        for i, buf in enumerate(self._bufs):
+            self._iov[i].iov_base = ctypes.addressof(buf)
+            self._iov[i].iov_len = datagram_size
+            hdr = self._msgs[i].msg_hdr
+            hdr.msg_iov = ctypes.pointer(self._iov[i])
+            hdr.msg_iovlen = 1
+
+    def recv(self) -> List[bytes]:
+        """
+        Read up to ``max_batch`` queued datagrams without blocking.
+
+        Returns:
+            The datagrams read (empty if none were pending)
+
+        Raises:
+            OSError: The read failed for a reason other than an empty queue
+        """
+        count = _libc.recvmmsg(self._fd, self._msgs, self.max_batch, _MSG_DONTWAIT, None)
+        if count < 0:
+            err = ctypes.get_errno()
+            if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                return []
+            raise OSError(err, os.strerror(err))
+        return [
+            ctypes.string_at(self._bufs[i], self._msgs[i].msg_len)
+            for i in range(count)
+        ]
+
+
+def create_sender(sock: socket.socket, dest: Tuple[str, int], max_batch: int) -> Optional[MMsgSender]:
+    """Return an MMsgSender for ``sock``, or None if sendmmsg is unavailable."""
+    if _libc is None or sock.family != socket.AF_INET:
+        return None
+    try:
+        return MMsgSender(sock, dest, max_batch)
+    except OSError:
+        return None
+
+
+def create_receiver(sock: socket.socket, max_batch: int, datagram_size: int) -> Optional[MMsgReceiver]:
+    """Return an MMsgReceiver for ``sock``, or None if recvmmsg is unavailable."""
+    if _libc is None or not hasattr(_libc, "recvmmsg"):
+        return None
+    return MMsgReceiver(sock, max_batch, datagram_size)
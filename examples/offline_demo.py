@@ -102,4 +102,9 @@ async def demo_ai_composition():
         print(f"❌ Demo error: {e}")
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(demo_ai_composition())
\ No newline at end of file
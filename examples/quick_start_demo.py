@@ -57,10 +57,14 @@ async def demo_basic_operations():
             ("return", "Reverb")
         ]
         
-        for track_type, name in tracks:
-            result = await tools.create_track(track_type, name)
+        # Issue all creates at once; the client orders them and only the
+        # first one waits for a round-trip to Live
+        results = await asyncio.gather(*(tools.create_track(t, n) for t, n in tracks))
+        for result in results:
             print(f"• {result['message']}")
-            await asyncio.sleep(0.2)  # Small delay between operations
+        
+        # One round-trip barrier: Live answers only after handling every create
+        print(f"• Track Count: {await tools.get_track_count()}")
         
         print("\n🎵 Basic setup complete!")
         
@@ -167,4 +171,9 @@ async def main():
     print('• "Add a kick track and set the tempo to 128 BPM"')
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
@@ -3,56 +3,58 @@
 AbletonOSC Installation Helper Script
 """
 
+import functools
+import io
 import os
 import platform
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
 import urllib.request
 import zipfile
 import shutil
 
+# Candidate Remote Scripts directories per platform.system(), most likely first
+_CANDIDATES_BY_OS = {
+    "Darwin": (
+        Path.home() / "Library" / "Application Support" / "Ableton" / "Live 11" / "Preferences" / "User Remote Scripts",
+        Path.home() / "Library" / "Application Support" / "Ableton" / "Live 12" / "Preferences" / "User Remote Scripts",
+        Path.home() / "Music" / "Ableton" / "User Library" / "Remote Scripts"
+    ),
+    "Windows": (
+        Path.home() / "Documents" / "Ableton" / "User Library" / "Remote Scripts",
+        Path(os.environ.get("USERPROFILE", "")) / "Documents" / "Ableton" / "User Library" / "Remote Scripts"
+    ),
+    "Linux": (
+        Path.home() / ".ableton" / "Live" / "User Library" / "Remote Scripts",
+    )
+}
+
+@functools.lru_cache(maxsize=1)
 def get_ableton_remote_scripts_path():
     """Get the path to Ableton Live's Remote Scripts directory."""
-    system = platform.system()
-    
-    if system == "Darwin":  # macOS
-        # Check common Ableton Live installation paths
-        possible_paths = [
-            Path.home() / "Library" / "Application Support" / "Ableton" / "Live 11" / "Preferences" / "User Remote Scripts",
-            Path.home() / "Library" / "Application Support" / "Ableton" / "Live 12" / "Preferences" / "User Remote Scripts",
-            Path.home() / "Music" / "Ableton" / "User Library" / "Remote Scripts"
-        ]
-    elif system == "Windows":
-        # Windows paths
-        possible_paths = [
-            Path.home() / "Documents" / "Ableton" / "User Library" / "Remote Scripts",
-            Path(os.environ.get("USERPROFILE", "")) / "Documents" / "Ableton" / "User Library" / "Remote Scripts"
-        ]
-    else:  # Linux
-        possible_paths = [
-            Path.home() / ".ableton" / "Live" / "User Library" / "Remote Scripts"
-        ]
+    possible_paths = _CANDIDATES_BY_OS.get(platform.system(), _CANDIDATES_BY_OS["Linux"])
     
     # Find the first existing path
     for path in possible_paths:
-        if path.exists():
+        if path.is_dir():
             return path
     
     # If none exist, return the most likely path for creation
     return possible_paths[0] if possible_paths else None
 
 def download_ableton_osc():
-    """Download AbletonOSC from GitHub."""
+    """Download the AbletonOSC archive from GitHub into memory (it is well under 1 MB)."""
     print("📥 Downloading AbletonOSC...")
     
     url = "https://github.com/ideoforms/AbletonOSC/archive/refs/heads/main.zip"
-    temp_file = Path("AbletonOSC-main.zip")
     
     try:
-        urllib.request.urlretrieve(url, temp_file)
+        with urllib.request.urlopen(url) as response:
+            data = response.read()
         print("✅ Download completed")
-        return temp_file
+        return data
     except Exception as e:
         print(f"❌ Download failed: {e}")
         return None
@@ -78,28 +80,46 @@ def install_ableton_osc():
     remote_scripts_path.mkdir(parents=True, exist_ok=True)
     
     # Download AbletonOSC
-    zip_file = download_ableton_osc()
-    if not zip_file:
+    zip_data = download_ableton_osc()
+    if not zip_data:
         return False
     
+    target_path = remote_scripts_path / "AbletonOSC"
+    # Extract next to the target and only swap it in once extraction has
+    # succeeded, so a failed install leaves the existing one untouched
+    staging_path = Path(tempfile.mkdtemp(prefix=".AbletonOSC-", dir=remote_scripts_path))
+    # mkdtemp creates the directory private (0700); install it like a normal one
+    staging_path.chmod(0o755)
     try:
-        # Extract the zip file
+        # Write each member straight to its final location, dropping the
+        # archive's top-level "AbletonOSC-main/" folder
         print("📦 Extracting AbletonOSC...")
-        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
-            zip_ref.extractall(".")
-        
-        # Move the AbletonOSC folder to Remote Scripts
-        source_path = Path("AbletonOSC-main")
-        target_path = remote_scripts_path / "AbletonOSC"
+        staging_root = staging_path.resolve()
+        with zipfile.ZipFile(io.BytesIO(zip_data), 'r') as zip_ref:
+            for member in zip_ref.infolist():
+                rel = member.filename.split("/", 1)[1] if "/" in member.filename else ""
+                if not rel:
+                    continue
+                dest = staging_path / rel
+                # Skip members that would land outside the install directory
+                # ("../x", or absolute paths such as "AbletonOSC-main//etc/x")
+                if not dest.resolve().is_relative_to(staging_root):
+                    continue
+                if member.is_dir():
+                    dest.mkdir(parents=True, exist_ok=True)
+                    continue
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                with zip_ref.open(member) as src, open(dest, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=1 << 20)
         
         if target_path.exists():
-            print("🔄 Removing existing AbletonOSC installation...")
-            shutil.rmtree(target_path)
-        
-        shutil.move(str(source_path), str(target_path))
-        
-        # Clean up
-        zip_file.unlink()
+            print("🔄 Replacing existing AbletonOSC installation...")
+            old_path = staging_path.with_name(staging_path.name + "-old")
+            target_path.rename(old_path)
+            staging_path.rename(target_path)
+            shutil.rmtree(old_path, ignore_errors=True)
+        else:
+            staging_path.rename(target_path)
         
         print("✅ AbletonOSC installed successfully!")
         print(f"📁 Installed to: {target_path}")
@@ -107,6 +127,7 @@ def install_ableton_osc():
         return True
         
     except Exception as e:
+        shutil.rmtree(staging_path, ignore_errors=True)
         print(f"❌ Installation failed: {e}")
         return False
 
@@ -0,0 +1,48 @@
+"""
+Read-only record helpers shared by the knowledge base tables.
+"""
+
+from collections.abc import Mapping
+
+
+def plain(value):
+    """Copy records, read-only tables and tuples into plain dicts and lists (e.g. for json.dumps)."""
+    if isinstance(value, Mapping):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list, frozenset)):
+        return [plain(item) for item in value]
+    return value
+
+
+class DictAccess(Mapping):
+    """
+    Read-only mapping of a record's field names to values, for existing dict callers.
+    
+    Subclasses are dataclasses that set _FIELDS (field names in order) and
+    _FIELD_NAMES (the same names as a frozenset) once the class is built.
+    """
+    
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        """Dict-style access (record["description"])."""
+        if key not in self._FIELD_NAMES:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._FIELD_NAMES
+    
+    def get(self, key: str, default=None):
+        """Dict-style .get()."""
+        return getattr(self, key) if key in self._FIELD_NAMES else default
+    
+    def __iter__(self):
+        return iter(self._FIELDS)
+    
+    def __len__(self):
+        return len(self._FIELDS)
+    
+    def to_dict(self) -> dict:
+        """Get the record as a plain (mutable) nested dict, e.g. for json.dumps."""
+        return plain(self)
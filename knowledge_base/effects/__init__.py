@@ -5,29 +5,139 @@ This module contains comprehensive information about Ableton Live Suite effects,
 including categorization, presets, parameters, and genre-specific usage patterns.
 """
 
-from .dynamics import DYNAMICS_EFFECTS
-from .eq import EQ_EFFECTS
-from .filters import FILTER_EFFECTS
-from .reverb import REVERB_EFFECTS
-from .delay import DELAY_EFFECTS
-from .modulation import MODULATION_EFFECTS
-from .distortion import DISTORTION_EFFECTS
-from .utility import UTILITY_EFFECTS
+import re
+from bisect import bisect_left, bisect_right
+from collections.abc import Mapping
+from enum import IntEnum
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+
+from ._frozen import freeze, genre_set, normalize_query
+from .spec import EffectSpec, EnumParam, NumParam
+
+# Category -> (submodule, attribute) holding its effects. Submodules are only
+# imported when a category (or its attribute, e.g. DELAY_EFFECTS) is used.
+_CATEGORY_MODULES = {
+    "dynamics": ("dynamics", "DYNAMICS_EFFECTS"),
+    "eq": ("eq", "EQ_EFFECTS"),
+    "filters": ("filters", "FILTER_EFFECTS"),
+    "reverb": ("reverb", "REVERB_EFFECTS"),
+    "delay": ("delay", "DELAY_EFFECTS"),
+    "modulation": ("modulation", "MODULATION_EFFECTS"),
+    "distortion": ("distortion", "DISTORTION_EFFECTS"),
+    "utility": ("utility", "UTILITY_EFFECTS")
+}
+
+_LAZY_ATTRIBUTES = {attr: module for module, attr in _CATEGORY_MODULES.values()}
+
+__all__ = [
+    *_LAZY_ATTRIBUTES,
+    "ALL_EFFECTS",
+    "EFFECTS_BY_ID",
+    "EFFECTS_DB",
+    "EffectID",
+    "EffectSpec",
+    "effect_has_genre",
+    "EnumParam",
+    "find_preset",
+    "NAME_TO_ID",
+    "NumParam",
+    "GENRE_EFFECT_CHAINS",
+    "get_effect",
+    "get_effects_by_category",
+    "get_effects_by_genre",
+    "get_effect_chain_by_genre",
+    "normalize_query",
+    "search_effects",
+    "search_params"
+]
+
+
+def __getattr__(name: str):
+    """Import a category's submodule, or build a derived table, on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    elif name in _DERIVED_ATTRIBUTES:
+        value = _DERIVED_ATTRIBUTES[name]()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | set(_DERIVED_ATTRIBUTES))
+
+
+def _lazy(name: str):
+    """Look up a lazily loaded module attribute from inside this module."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+class _EffectsDatabase(Mapping):
+    """Read-only category -> effects mapping that loads categories on demand."""
+    
+    def __getitem__(self, category: str):
+        _, attr = _CATEGORY_MODULES[category]
+        return _lazy(attr)
+    
+    def __iter__(self):
+        return iter(_CATEGORY_MODULES)
+    
+    def __len__(self):
+        return len(_CATEGORY_MODULES)
+
 
 # Master effects database
-EFFECTS_DB = {
-    "dynamics": DYNAMICS_EFFECTS,
-    "eq": EQ_EFFECTS,
-    "filters": FILTER_EFFECTS,
-    "reverb": REVERB_EFFECTS,
-    "delay": DELAY_EFFECTS,
-    "modulation": MODULATION_EFFECTS,
-    "distortion": DISTORTION_EFFECTS,
-    "utility": UTILITY_EFFECTS
+EFFECTS_DB = _EffectsDatabase()
+
+
+def _build_all_effects():
+    """Flatten every category into one name -> spec table (first category wins)."""
+    all_effects = {}
+    for effects in EFFECTS_DB.values():
+        for name, spec in effects.items():
+            all_effects.setdefault(name, spec)
+    return MappingProxyType(all_effects)
+
+
+def _build_genre_index():
+    """Map each genre to the names of the effects listing it, in ALL_EFFECTS order."""
+    index = {}
+    for name, spec in _lazy("ALL_EFFECTS").items():
+        for genre in spec.genres:
+            index.setdefault(genre, []).append(name)
+    return MappingProxyType({genre: tuple(names) for genre, names in index.items()})
+
+
+def _build_effect_ids():
+    """Build the EffectID enum: one member per ALL_EFFECTS name (EQ_Eight -> EQ_EIGHT)."""
+    return IntEnum("EffectID", [(name.upper(), i) for i, name in enumerate(_lazy("ALL_EFFECTS"))], module=__name__)
+
+
+# Tables derived from every category, built on first access
+_DERIVED_ATTRIBUTES = {
+    "ALL_EFFECTS": _build_all_effects,
+    "_GENRE_INDEX": _build_genre_index,
+    # Effect name -> frozenset of its genres, for membership tests
+    "_EFFECT_GENRES": lambda: MappingProxyType({
+        name: genre_set(spec.genres) for name, spec in _lazy("ALL_EFFECTS").items()
+    }),
+    "EffectID": _build_effect_ids,
+    # Specs indexed by EffectID value (a tuple index instead of a string hash)
+    "EFFECTS_BY_ID": lambda: tuple(_lazy("ALL_EFFECTS").values()),
+    # The single string -> EffectID conversion for API boundaries
+    "NAME_TO_ID": lambda: MappingProxyType({
+        name: _lazy("EffectID")(i) for i, name in enumerate(_lazy("ALL_EFFECTS"))
+    })
 }
 
-# Effect chains by genre
-GENRE_EFFECT_CHAINS = {
+# Effect chains by genre (read-only)
+GENRE_EFFECT_CHAINS = freeze({
     "techno": {
         "drums": ["EQ", "Compressor", "Saturator", "Filter"],
         "bass": ["EQ", "Compressor", "Saturator", "Utility"],
@@ -46,7 +156,22 @@ GENRE_EFFECT_CHAINS = {
         "bass": ["EQ", "Compressor", "Phaser"],
         "master": ["EQ", "Multiband Compressor", "Limiter"]
     }
-}
+})
+
+def get_effect(name):
+    """Get an effect's spec by name (or EffectID) from any category."""
+    if isinstance(name, int):
+        return _lazy("EFFECTS_BY_ID")[name]
+    return _lazy("ALL_EFFECTS").get(name)
+
+def get_effects_by_genre(genre: str):
+    """Get the names of effects tagged with a genre (effects tagged "all" are under "all")."""
+    return _lazy("_GENRE_INDEX").get(genre if genre.islower() else genre.lower(), ())
+
+def effect_has_genre(name: str, genre: str) -> bool:
+    """Check whether an effect lists a genre ("all" is not expanded)."""
+    genres = _lazy("_EFFECT_GENRES").get(name)
+    return genres is not None and (genre if genre.islower() else genre.lower()) in genres
 
 def get_effects_by_category(category: str = None):
     """Get effects filtered by category."""
@@ -54,22 +179,132 @@ def get_effects_by_category(category: str = None):
         return EFFECTS_DB.get(category, {})
     return EFFECTS_DB
 
+# Flattened chain lookups: (genre, track type) -> chain, and genre -> chains
+_CHAIN_BY_GENRE_AND_TYPE = {
+    (genre.lower(), track_type): tuple(chain)
+    for genre, chains in GENRE_EFFECT_CHAINS.items()
+    for track_type, chain in chains.items()
+}
+_CHAINS_BY_GENRE = {
+    genre.lower(): MappingProxyType({track_type: tuple(chain) for track_type, chain in chains.items()})
+    for genre, chains in GENRE_EFFECT_CHAINS.items()
+}
+_NO_CHAINS = MappingProxyType({})
+
 def get_effect_chain_by_genre(genre: str, track_type: str = None):
     """Get recommended effect chain for genre and track type."""
-    genre_chains = GENRE_EFFECT_CHAINS.get(genre.lower(), {})
+    # Keys are all lowercase, so lowercase queries skip the str.lower() copy
+    if not genre.islower():
+        genre = genre.lower()
     if track_type:
-        return genre_chains.get(track_type, [])
-    return genre_chains
+        return _CHAIN_BY_GENRE_AND_TYPE.get((genre, track_type), ())
+    return _CHAINS_BY_GENRE.get(genre, _NO_CHAINS)
+
+@lru_cache(maxsize=None)
+def _search_tables():
+    """
+    Build the search tables on first use (this loads every category).
+    
+    Returns:
+        (per category: one lowercased blob of "name\x1edescription" entries
+        joined by "\x1f", the entries' start offsets and their names;
+        every word of those texts mapped to all effects containing it)
+    """
+    blobs = {}
+    for category, effects in EFFECTS_DB.items():
+        names = list(effects)
+        entries = [f"{name}\x1e{effects[name].description}".lower() for name in names]
+        starts = []
+        offset = 0
+        for entry in entries:
+            starts.append(offset)
+            offset += len(entry) + 1
+        blobs[category] = ("\x1f".join(entries), starts, names)
+    
+    words = {word for blob, _, _ in blobs.values() for word in re.findall(r"[^\W_]+", blob)}
+    search_index = {word: tuple(_scan_blobs(blobs, word)) for word in words}
+    return blobs, search_index
+
+def _scan_blobs(blobs, term: str):
+    """Yield (category, name) for every effect whose text contains ``term``."""
+    for category, (blob, starts, names) in blobs.items():
+        i = blob.find(term)
+        while i != -1:
+            entry = bisect_right(starts, i) - 1
+            yield category, names[entry]
+            if entry + 1 == len(starts):
+                break
+            # Resume at the next entry so each effect is reported once
+            i = blob.find(term, starts[entry + 1])
 
 def search_effects(search_term: str):
-    """Search effects by name or description."""
+    """Search effects by name or description (results are plain dicts, e.g. for json.dumps)."""
+    blobs, search_index = _search_tables()
+    term = search_term.lower()
+    hits = search_index.get(term)
+    if hits is None:
+        hits = _scan_blobs(blobs, term)
+    
     results = {}
-    for category, effects in EFFECTS_DB.items():
-        category_results = {}
-        for name, info in effects.items():
-            if (search_term.lower() in name.lower() or 
-                search_term.lower() in info.get("description", "").lower()):
-                category_results[name] = info
-        if category_results:
-            results[category] = category_results
-    return results
\ No newline at end of file
+    for category, name in hits:
+        results.setdefault(category, {})[name] = EFFECTS_DB[category][name].to_dict()
+    return results
+
+@lru_cache(maxsize=None)
+def _param_index():
+    """Get (lowercased parameter name, effect, parameter) for every parameter, sorted."""
+    return tuple(sorted(
+        (param.lower(), effect, param)
+        for effect, spec in _lazy("ALL_EFFECTS").items()
+        for param in spec.key_parameters
+    ))
+
+def search_params(prefix: str):
+    """
+    Find parameters whose name starts with ``prefix`` (case-insensitive).
+    
+    Args:
+        prefix: Start of a parameter name (e.g. "thr")
+        
+    Returns:
+        List of (effect name, parameter name) pairs, ordered by parameter name
+    """
+    index = _param_index()
+    key = prefix.lower()
+    results = []
+    for i in range(bisect_left(index, (key,)), len(index)):
+        lowered, effect, param = index[i]
+        if not lowered.startswith(key):
+            break
+        results.append((effect, param))
+    return results
+
+@lru_cache(maxsize=None)
+def _sorted_presets(effect_name: str):
+    """Get (lowercased name, preset type, name) for every preset of an effect, sorted."""
+    spec = _lazy("ALL_EFFECTS")[effect_name]
+    return tuple(sorted(
+        (name.lower(), preset_type, name)
+        for preset_type, names in spec.presets.items()
+        for name in names
+    ))
+
+def find_preset(effect_name: str, preset_name: str):
+    """
+    Find a preset of an effect by name (case-insensitive).
+    
+    Args:
+        effect_name: Effect name (e.g. "Compressor")
+        preset_name: Preset name (e.g. "punchy drums")
+        
+    Returns:
+        (preset type, exact preset name), or None if the effect or preset is unknown
+    """
+    if effect_name not in _lazy("ALL_EFFECTS"):
+        return None
+    presets = _sorted_presets(effect_name)
+    key = preset_name.lower()
+    i = bisect_left(presets, (key,))
+    if i < len(presets) and presets[i][0] == key:
+        return presets[i][1], presets[i][2]
+    return None
@@ -0,0 +1,172 @@
+"""
+Helpers for the read-only effect tables.
+"""
+
+import sys
+from dataclasses import astuple
+from types import MappingProxyType
+
+from .spec import EffectSpec, EnumParam, NumParam
+
+# Longer strings (descriptions, usage tips) are unique prose not worth interning
+_INTERN_MAX_LENGTH = 32
+
+
+def _intern(value):
+    if isinstance(value, str) and len(value) < _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def intern_strings(obj):
+    """
+    Rebuild nested dicts/lists/tuples with every short string interned.
+    
+    Keys repeated across hundreds of entries ("default", "unit", preset and
+    genre names) then share one object, and lookups with them compare by
+    identity.
+    """
+    if isinstance(obj, str):
+        return _intern(obj)
+    if isinstance(obj, dict):
+        return {_intern(k): intern_strings(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(intern_strings(v) for v in obj)
+    return obj
+
+
+# One shared tuple per distinct genre list, and the frozenset of each
+_GENRE_TUPLES = {}
+_GENRE_SETS = {}
+
+
+def share_genres(effects: dict) -> dict:
+    """
+    Replace each spec's "genres" list with a shared tuple, in place.
+    
+    Genres keep their authored order, and specs with the same genres
+    (e.g. just "all") reference a single object.
+    """
+    for spec in effects.values():
+        genres = tuple(_intern(genre) for genre in spec["genres"])
+        spec["genres"] = _GENRE_TUPLES.setdefault(genres, genres)
+    return effects
+
+
+def genre_set(genres: tuple) -> frozenset:
+    """Get the shared frozenset of a genres tuple, for O(1) membership tests."""
+    frozen = _GENRE_SETS.get(genres)
+    if frozen is None:
+        frozen = _GENRE_SETS[genres] = frozenset(genres)
+    return frozen
+
+
+_SCALARS = (str, int, float, bool, type(None))
+
+# One shared read-only object per distinct leaf table / tuple (flyweights)
+_POOL = {}
+
+
+def _pool_key(frozen):
+    """
+    Key a frozen leaf by its exact contents, or None if it holds containers.
+    
+    Types are part of the key so 0, 0.0 and False stay distinct, and item
+    order is kept so a pooled table iterates like the literal it replaced.
+    """
+    items = frozen.items() if isinstance(frozen, MappingProxyType) else enumerate(frozen)
+    key = [type(frozen)]
+    for k, v in items:
+        if not isinstance(v, _SCALARS):
+            return None
+        key.append((k, type(v), v))
+    return tuple(key)
+
+
+def deep_freeze(obj):
+    """
+    Recursively wrap dicts in MappingProxyType and turn lists into tuples.
+    
+    The result can be handed out without defensive copies: nothing
+    reachable from it can be mutated. Identical leaf tables (e.g. the
+    {"min": -15, "max": 15, "default": 0, "unit": "dB"} EQ gain ranges)
+    come back as one shared object.
+    """
+    if isinstance(obj, dict):
+        frozen = MappingProxyType({k: deep_freeze(v) for k, v in obj.items()})
+    elif isinstance(obj, (list, tuple)):
+        frozen = tuple(deep_freeze(v) for v in obj)
+    else:
+        return obj
+    key = _pool_key(frozen)
+    return frozen if key is None else _POOL.setdefault(key, frozen)
+
+
+def freeze(table: dict) -> MappingProxyType:
+    """Intern a table's strings and return a deeply read-only view of it."""
+    return deep_freeze(intern_strings(table))
+
+
+def normalize_query(**kwargs):
+    """
+    Lowercase and intern the string arguments of a query in one place.
+    
+    Call this once where a request enters (e.g. an MCP tool handler); the
+    getters' lowercase fast path then never copies the strings again.
+    
+    Returns:
+        The keyword arguments with every string normalized
+    """
+    return {
+        key: sys.intern(value.lower()) if isinstance(value, str) else value
+        for key, value in kwargs.items()
+    }
+
+
+# One shared record per distinct parameter description
+_PARAMS = {}
+
+
+def build_param(info: dict):
+    """
+    Turn a key_parameters entry into a shared NumParam or EnumParam record.
+    
+    Field types are part of the pool key, so a 0 default never comes back
+    as 0.0 from another effect's record.
+    """
+    if "options" in info:
+        param = EnumParam(options=deep_freeze(info["options"]), default=info["default"])
+    else:
+        param = NumParam(
+            min=info["min"],
+            max=info["max"],
+            default=info["default"],
+            unit=info.get("unit", "")
+        )
+    key = (type(param), tuple((type(value), value) for value in astuple(param)))
+    return _PARAMS.setdefault(key, param)
+
+
+def build_specs(effects: dict) -> MappingProxyType:
+    """
+    Turn a module's effect literals into a read-only name -> EffectSpec table.
+    
+    Strings are interned and genre lists become shared tuples first;
+    parameters become NumParam/EnumParam records and the other nested
+    tables are deeply read-only, so callers never need to copy them.
+    """
+    effects = share_genres(intern_strings(effects))
+    return MappingProxyType({
+        name: EffectSpec(
+            description=spec["description"],
+            category=spec["category"],
+            genres=spec["genres"],
+            presets=deep_freeze(spec["presets"]),
+            key_parameters=MappingProxyType({
+                param: build_param(info) for param, info in spec["key_parameters"].items()
+            }),
+            usage_tips=deep_freeze(spec["usage_tips"]),
+            device_path=spec["device_path"]
+        )
+        for name, spec in effects.items()
+    })
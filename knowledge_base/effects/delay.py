@@ -5,19 +5,21 @@ Comprehensive database of delay effects including simple delays, multi-tap delay
 and specialized delay processors.
 """
 
+from ._frozen import build_specs
+
 DELAY_EFFECTS = {
     "Simple_Delay": {
         "description": "Basic stereo delay with tempo sync and filtering",
         "category": "delay",
-        "genres": ["all"],
+        "genres": ("all",),
         "presets": {
-            "musical": ["Quarter Note", "Eighth Note", "Dotted Eighth", "Sixteenth Note"],
-            "creative": ["Ping Pong", "Wide Stereo", "Mono Echo", "Slap Back"],
-            "genre": ["Dub Delay", "Rock Delay", "Electronic Delay", "Ambient Delay"]
+            "musical": ("Quarter Note", "Eighth Note", "Dotted Eighth", "Sixteenth Note"),
+            "creative": ("Ping Pong", "Wide Stereo", "Mono Echo", "Slap Back"),
+            "genre": ("Dub Delay", "Rock Delay", "Electronic Delay", "Ambient Delay")
         },
         "key_parameters": {
             "DelayTime": {"min": 1, "max": 2000, "default": 250, "unit": "ms"},
-            "Sync": {"options": ["Off", "On"], "default": "On"},
+            "Sync": {"options": ("Off", "On"), "default": "On"},
             "Offset": {"min": -50, "max": 50, "default": 0, "unit": "%"},
             "Feedback": {"min": 0, "max": 100, "default": 20, "unit": "%"},
             "DryWet": {"min": 0, "max": 100, "default": 25, "unit": "%"}
@@ -34,17 +36,17 @@ DELAY_EFFECTS = {
     "Ping_Pong_Delay": {
         "description": "Stereo ping-pong delay with independent left/right controls",
         "category": "delay",
-        "genres": ["electronic", "ambient", "pop", "rock"],
+        "genres": ("electronic", "ambient", "pop", "rock"),
         "presets": {
-            "sync": ["1/4 Ping Pong", "1/8 Ping Pong", "1/16 Ping Pong", "Dotted 1/8"],
-            "creative": ["Wide Bounce", "Narrow Bounce", "Asymmetric", "Triplet Bounce"],
-            "feedback": ["Subtle Echo", "Building Echo", "Infinite Echo", "Controlled Chaos"]
+            "sync": ("1/4 Ping Pong", "1/8 Ping Pong", "1/16 Ping Pong", "Dotted 1/8"),
+            "creative": ("Wide Bounce", "Narrow Bounce", "Asymmetric", "Triplet Bounce"),
+            "feedback": ("Subtle Echo", "Building Echo", "Infinite Echo", "Controlled Chaos")
         },
         "key_parameters": {
             "LeftTime": {"min": 1, "max": 2000, "default": 250, "unit": "ms"},
             "RightTime": {"min": 1, "max": 2000, "default": 375, "unit": "ms"},
             "Feedback": {"min": 0, "max": 100, "default": 30, "unit": "%"},
-            "Frozen": {"options": ["Off", "On"], "default": "Off"},
+            "Frozen": {"options": ("Off", "On"), "default": "Off"},
             "DryWet": {"min": 0, "max": 100, "default": 30, "unit": "%"}
         },
         "usage_tips": {
@@ -59,12 +61,12 @@ DELAY_EFFECTS = {
     "Grain_Delay": {
         "description": "Granular delay with pitch shifting and time stretching",
         "category": "delay",
-        "genres": ["experimental", "ambient", "electronic", "post-rock"],
+        "genres": ("experimental", "ambient", "electronic", "post-rock"),
         "presets": {
-            "granular": ["Granular Echo", "Pitch Delay", "Time Stretch", "Texture Delay"],
-            "creative": ["Shimmer", "Octave Down", "Octave Up", "Harmonizer"],
-            "ambient": ["Cloud Delay", "Evolving Echo", "Ethereal", "Soundscape"],
-            "rhythmic": ["Rhythmic Grains", "Polyrhythm", "Swing Grains", "Offset Grains"]
+            "granular": ("Granular Echo", "Pitch Delay", "Time Stretch", "Texture Delay"),
+            "creative": ("Shimmer", "Octave Down", "Octave Up", "Harmonizer"),
+            "ambient": ("Cloud Delay", "Evolving Echo", "Ethereal", "Soundscape"),
+            "rhythmic": ("Rhythmic Grains", "Polyrhythm", "Swing Grains", "Offset Grains")
         },
         "key_parameters": {
             "DelayTime": {"min": 1, "max": 2000, "default": 500, "unit": "ms"},
@@ -85,12 +87,12 @@ DELAY_EFFECTS = {
     "Filter_Delay": {
         "description": "Delay with built-in filter and LFO modulation",
         "category": "delay",
-        "genres": ["electronic", "techno", "dub", "ambient"],
+        "genres": ("electronic", "techno", "dub", "ambient"),
         "presets": {
-            "filtered": ["LP Delay", "HP Delay", "BP Delay", "Notch Delay"],
-            "modulated": ["Wobble Delay", "Sweep Delay", "Tremolo Delay", "Filter LFO"],
-            "dub": ["Dub Echo", "Filter Dub", "Deep Dub", "Space Dub"],
-            "techno": ["Acid Delay", "Industrial Echo", "Underground", "Peak Delay"]
+            "filtered": ("LP Delay", "HP Delay", "BP Delay", "Notch Delay"),
+            "modulated": ("Wobble Delay", "Sweep Delay", "Tremolo Delay", "Filter LFO"),
+            "dub": ("Dub Echo", "Filter Dub", "Deep Dub", "Space Dub"),
+            "techno": ("Acid Delay", "Industrial Echo", "Underground", "Peak Delay")
         },
         "key_parameters": {
             "DelayTime": {"min": 1, "max": 2000, "default": 375, "unit": "ms"},
@@ -107,4 +109,6 @@ DELAY_EFFECTS = {
         },
         "device_path": "Live/Filter Delay"
     }
-}
\ No newline at end of file
+}
+
+DELAY_EFFECTS = build_specs(DELAY_EFFECTS)
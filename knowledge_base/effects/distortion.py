@@ -5,16 +5,18 @@ Comprehensive database of distortion effects including overdrive, distortion,
 saturation, and specialized harmonic processors.
 """
 
+from ._frozen import build_specs
+
 DISTORTION_EFFECTS = {
     "Saturator": {
         "description": "Multimode saturation and distortion processor",
         "category": "distortion",
-        "genres": ["all"],
+        "genres": ("all",),
         "presets": {
-            "tape": ["Tape Saturation", "Warm Tape", "Hot Tape", "Vintage Tape"],
-            "tube": ["Tube Warmth", "Tube Drive", "Valve Saturation", "Classic Tube"],
-            "digital": ["Digital Clip", "Bit Crush", "Digital Fuzz", "Lo-Fi"],
-            "analog": ["Analog Clip", "Soft Clip", "Hard Clip", "Asymmetric"]
+            "tape": ("Tape Saturation", "Warm Tape", "Hot Tape", "Vintage Tape"),
+            "tube": ("Tube Warmth", "Tube Drive", "Valve Saturation", "Classic Tube"),
+            "digital": ("Digital Clip", "Bit Crush", "Digital Fuzz", "Lo-Fi"),
+            "analog": ("Analog Clip", "Soft Clip", "Hard Clip", "Asymmetric")
         },
         "key_parameters": {
             "Drive": {"min": 0, "max": 36, "default": 0, "unit": "dB"},
@@ -35,12 +37,12 @@ DISTORTION_EFFECTS = {
     "Overdrive": {
         "description": "Guitar-style overdrive with tone shaping",
         "category": "distortion",
-        "genres": ["rock", "blues", "electronic", "industrial"],
+        "genres": ("rock", "blues", "electronic", "industrial"),
         "presets": {
-            "guitar": ["Blues Drive", "Rock Overdrive", "Lead Drive", "Rhythm Drive"],
-            "bass": ["Bass Drive", "Tube Bass", "Distorted Bass", "Fuzz Bass"],
-            "electronic": ["Synth Drive", "Analog Drive", "Digital Drive", "Warm Drive"],
-            "extreme": ["Heavy Drive", "Fuzz Drive", "Blown Drive", "Screaming Drive"]
+            "guitar": ("Blues Drive", "Rock Overdrive", "Lead Drive", "Rhythm Drive"),
+            "bass": ("Bass Drive", "Tube Bass", "Distorted Bass", "Fuzz Bass"),
+            "electronic": ("Synth Drive", "Analog Drive", "Digital Drive", "Warm Drive"),
+            "extreme": ("Heavy Drive", "Fuzz Drive", "Blown Drive", "Screaming Drive")
         },
         "key_parameters": {
             "Drive": {"min": 0, "max": 100, "default": 50, "unit": "%"},
@@ -61,12 +63,12 @@ DISTORTION_EFFECTS = {
     "Amp": {
         "description": "Guitar amplifier simulation with cabinet modeling",
         "category": "distortion",
-        "genres": ["rock", "blues", "jazz", "metal", "electronic"],
+        "genres": ("rock", "blues", "jazz", "metal", "electronic"),
         "presets": {
-            "clean": ["Jazz Clean", "Vintage Clean", "Modern Clean", "Pristine"],
-            "crunch": ["Classic Crunch", "British Crunch", "American Crunch", "Vintage Crunch"],
-            "lead": ["Lead Channel", "High Gain", "Metal Lead", "Solo Boost"],
-            "bass": ["Bass Amp", "Tube Bass", "Modern Bass", "Vintage Bass"]
+            "clean": ("Jazz Clean", "Vintage Clean", "Modern Clean", "Pristine"),
+            "crunch": ("Classic Crunch", "British Crunch", "American Crunch", "Vintage Crunch"),
+            "lead": ("Lead Channel", "High Gain", "Metal Lead", "Solo Boost"),
+            "bass": ("Bass Amp", "Tube Bass", "Modern Bass", "Vintage Bass")
         },
         "key_parameters": {
             "Gain": {"min": 0, "max": 100, "default": 50, "unit": "%"},
@@ -88,17 +90,17 @@ DISTORTION_EFFECTS = {
     "Cabinet": {
         "description": "Guitar cabinet simulation with microphone modeling",
         "category": "distortion",
-        "genres": ["rock", "blues", "jazz", "metal", "electronic"],
+        "genres": ("rock", "blues", "jazz", "metal", "electronic"),
         "presets": {
-            "guitar": ["4x12 Modern", "4x12 Vintage", "2x12 Combo", "1x12 Studio"],
-            "bass": ["8x10 Bass", "4x10 Bass", "1x15 Bass", "2x10 Bass"],
-            "vintage": ["Vintage 4x12", "Classic 2x12", "Old School", "Retro"],
-            "modern": ["Modern 4x12", "High Gain", "Metal Cab", "Studio Cab"]
+            "guitar": ("4x12 Modern", "4x12 Vintage", "2x12 Combo", "1x12 Studio"),
+            "bass": ("8x10 Bass", "4x10 Bass", "1x15 Bass", "2x10 Bass"),
+            "vintage": ("Vintage 4x12", "Classic 2x12", "Old School", "Retro"),
+            "modern": ("Modern 4x12", "High Gain", "Metal Cab", "Studio Cab")
         },
         "key_parameters": {
-            "Model": {"options": ["Various cabinet models"], "default": "4x12 Modern"},
-            "Microphone": {"options": ["Dynamic 57", "Dynamic 421", "Condenser 87", "Ribbon 121"], "default": "Dynamic 57"},
-            "Dual_Mic": {"options": ["Off", "On"], "default": "Off"},
+            "Model": {"options": ("Various cabinet models",), "default": "4x12 Modern"},
+            "Microphone": {"options": ("Dynamic 57", "Dynamic 421", "Condenser 87", "Ribbon 121"), "default": "Dynamic 57"},
+            "Dual_Mic": {"options": ("Off", "On"), "default": "Off"},
             "Distance": {"min": 0, "max": 100, "default": 50, "unit": "%"},
             "Output": {"min": -30, "max": 30, "default": 0, "unit": "dB"}
         },
@@ -114,12 +116,12 @@ DISTORTION_EFFECTS = {
     "Erosion": {
         "description": "Digital degradation and bit-crushing processor",
         "category": "distortion",
-        "genres": ["electronic", "experimental", "industrial", "lo-fi"],
+        "genres": ("electronic", "experimental", "industrial", "lo-fi"),
         "presets": {
-            "digital": ["Bit Crush", "Sample Rate", "Digital Fuzz", "Glitch"],
-            "analog": ["Vinyl", "Tape", "Radio", "Phone"],
-            "extreme": ["Heavy Crush", "Aliasing", "Noise", "Broken"],
-            "subtle": ["Vintage Digital", "Warm Crush", "Soft Degrade", "Character"]
+            "digital": ("Bit Crush", "Sample Rate", "Digital Fuzz", "Glitch"),
+            "analog": ("Vinyl", "Tape", "Radio", "Phone"),
+            "extreme": ("Heavy Crush", "Aliasing", "Noise", "Broken"),
+            "subtle": ("Vintage Digital", "Warm Crush", "Soft Degrade", "Character")
         },
         "key_parameters": {
             "Frequency": {"min": 100, "max": 18000, "default": 8000, "unit": "Hz"},
@@ -135,4 +137,6 @@ DISTORTION_EFFECTS = {
         },
         "device_path": "Live/Erosion"
     }
-}
\ No newline at end of file
+}
+
+DISTORTION_EFFECTS = build_specs(DISTORTION_EFFECTS)
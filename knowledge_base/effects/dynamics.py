@@ -5,6 +5,11 @@ Comprehensive database of dynamics processing effects including compressors,
 limiters, gates, and expanders.
 """
 
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Optional, Tuple
+
+from ._frozen import build_specs, freeze
+
 DYNAMICS_EFFECTS = {
     "Compressor": {
         "description": "Standard compressor with ratio, attack, and release controls",
@@ -105,8 +110,10 @@ DYNAMICS_EFFECTS = {
     }
 }
 
-# Dynamics processing by genre
-GENRE_DYNAMICS = {
+DYNAMICS_EFFECTS = build_specs(DYNAMICS_EFFECTS)
+
+# Dynamics processing by genre (read-only)
+GENRE_DYNAMICS = freeze({
     "techno": {
         "characteristics": ["aggressive", "punchy", "controlled"],
         "typical_chain": ["Gate", "Compressor", "Limiter"],
@@ -137,29 +144,54 @@ GENRE_DYNAMICS = {
             "limiting": "transparent"
         }
     }
+})
+
+# Shared result for unknown genres
+_EMPTY: Final[Mapping[str, Any]] = MappingProxyType({})
+
+def get_dynamics_by_genre(genre: str) -> Mapping[str, Any]:
+    """Get dynamics effects and settings (read-only) for a specific genre."""
+    # Keys are all lowercase, so lowercase queries skip the str.lower() copy
+    try:
+        return GENRE_DYNAMICS[genre if genre.islower() else genre.lower()]
+    except KeyError:
+        return _EMPTY
+
+# Base compressor settings per instrument type
+_BASE_COMPRESSOR_SETTINGS: Final[Dict[str, Dict[str, float]]] = {
+    "drums": {"ratio": 4, "attack": 3, "release": 100},
+    "bass": {"ratio": 3, "attack": 10, "release": 50},
+    "vocals": {"ratio": 3, "attack": 5, "release": 150},
+    "master": {"ratio": 2, "attack": 30, "release": 300}
 }
 
-def get_dynamics_by_genre(genre: str):
-    """Get dynamics effects and settings for a specific genre."""
-    return GENRE_DYNAMICS.get(genre.lower(), {})
-
-def get_compressor_settings(instrument_type: str, genre: str = None):
-    """Get recommended compressor settings for instrument type and genre."""
-    base_settings = {
-        "drums": {"ratio": 4, "attack": 3, "release": 100},
-        "bass": {"ratio": 3, "attack": 10, "release": 50},
-        "vocals": {"ratio": 3, "attack": 5, "release": 150},
-        "master": {"ratio": 2, "attack": 30, "release": 300}
-    }
-    
-    settings = base_settings.get(instrument_type.lower(), base_settings["master"])
-    
-    # Genre-specific adjustments
-    if genre == "techno":
-        settings["ratio"] *= 1.5
-        settings["attack"] *= 0.7
-    elif genre == "ambient":
-        settings["ratio"] *= 0.7
-        settings["attack"] *= 2
-        
-    return settings
\ No newline at end of file
+# Genre-specific (ratio, attack) multipliers
+_GENRE_ADJUST: Final[Dict[str, Tuple[float, float]]] = {
+    "techno": (1.5, 0.7),
+    "ambient": (0.7, 2)
+}
+
+def _build_compressor_settings() -> Dict[Tuple[str, Optional[str]], Mapping[str, float]]:
+    """Precompute the read-only settings for every (instrument type, genre) pair."""
+    table = {}
+    for instrument_type, base in _BASE_COMPRESSOR_SETTINGS.items():
+        table[(instrument_type, None)] = MappingProxyType(dict(base))
+        for genre, (ratio, attack) in _GENRE_ADJUST.items():
+            table[(instrument_type, genre)] = MappingProxyType({
+                **base,
+                "ratio": base["ratio"] * ratio,
+                "attack": base["attack"] * attack
+            })
+    return table
+
+_COMPRESSOR_SETTINGS: Final[Dict[Tuple[str, Optional[str]], Mapping[str, float]]] = _build_compressor_settings()
+
+def get_compressor_settings(instrument_type: str, genre: Optional[str] = None) -> Mapping[str, float]:
+    """Get recommended compressor settings (read-only) for instrument type and genre."""
+    if not instrument_type.islower():
+        instrument_type = instrument_type.lower()
+    if instrument_type not in _BASE_COMPRESSOR_SETTINGS:
+        instrument_type = "master"
+    if genre not in _GENRE_ADJUST:
+        genre = None
+    return _COMPRESSOR_SETTINGS[(instrument_type, genre)]
@@ -5,6 +5,8 @@ Comprehensive database of equalization effects including parametric EQs,
 graphic EQs, and specialized EQ tools.
 """
 
+from ._frozen import build_specs
+
 EQ_EFFECTS = {
     "EQ_Eight": {
         "description": "8-band parametric equalizer with spectrum analyzer",
@@ -99,4 +101,6 @@ EQ_EFFECTS = {
         },
         "device_path": "Live/Treble"
     }
-}
\ No newline at end of file
+}
+
+EQ_EFFECTS = build_specs(EQ_EFFECTS)
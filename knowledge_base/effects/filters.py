@@ -5,6 +5,8 @@ Comprehensive database of filter effects including low-pass, high-pass,
 band-pass filters and specialized filter tools.
 """
 
+from ._frozen import build_specs
+
 FILTER_EFFECTS = {
     "Auto_Filter": {
         "description": "Versatile filter with LFO modulation and envelope following",
@@ -73,4 +75,6 @@ FILTER_EFFECTS = {
         },
         "device_path": "Live/Simple Delay"
     }
-}
\ No newline at end of file
+}
+
+FILTER_EFFECTS = build_specs(FILTER_EFFECTS)
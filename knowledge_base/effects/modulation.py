@@ -5,6 +5,8 @@ Comprehensive database of modulation effects including chorus, flanger, phaser,
 tremolo, and other modulation processors.
 """
 
+from ._frozen import build_specs
+
 MODULATION_EFFECTS = {
     "Chorus": {
         "description": "Multi-voice chorus with delay and pitch modulation",
@@ -138,4 +140,6 @@ MODULATION_EFFECTS = {
         },
         "device_path": "Live/Frequency Shifter"
     }
-}
\ No newline at end of file
+}
+
+MODULATION_EFFECTS = build_specs(MODULATION_EFFECTS)
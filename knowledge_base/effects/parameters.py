@@ -0,0 +1,88 @@
+"""
+Vectorized Parameter Ranges
+
+All numeric effect parameters packed into one NumPy structured array, so a
+whole set of values can be validated or clamped in a single operation.
+Importing this module loads every effect category, checks that each
+default lies within its range, and requires NumPy.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+from . import ALL_EFFECTS
+from .spec import NumParam
+
+PARAM_DTYPE = np.dtype([
+    ("effect", "U32"),
+    ("param", "U24"),
+    ("min", "f4"),
+    ("max", "f4"),
+    ("default", "f4")
+])
+
+
+def _build_param_table() -> Tuple[np.ndarray, Dict[str, slice]]:
+    """Collect every min/max parameter, grouped by effect in ALL_EFFECTS order."""
+    rows = []
+    effect_rows = {}
+    for name, spec in ALL_EFFECTS.items():
+        start = len(rows)
+        for param, info in spec.key_parameters.items():
+            if isinstance(info, NumParam):
+                rows.append((name, param, info.min, info.max, info.default))
+        effect_rows[name] = slice(start, len(rows))
+
+    table = np.array(rows, dtype=PARAM_DTYPE)
+    table.flags.writeable = False
+    return table, effect_rows
+
+
+def _validate_param_table(table: np.ndarray) -> None:
+    """
+    Check every range at once: min <= default <= max.
+    
+    Raises:
+        ValueError: Listing each effect parameter with an invalid range
+    """
+    bad = (table["min"] > table["default"]) | (table["default"] > table["max"])
+    if bad.any():
+        names = ", ".join(f"{row['effect']}.{row['param']}" for row in table[bad])
+        raise ValueError(f"Invalid parameter ranges: {names}")
+
+
+PARAM_TABLE, _EFFECT_ROWS = _build_param_table()
+_validate_param_table(PARAM_TABLE)
+
+
+def parameter_names(effect: str) -> Tuple[str, ...]:
+    """Get the numeric parameters of an effect, in the order clamp() expects."""
+    return tuple(PARAM_TABLE["param"][_EFFECT_ROWS[effect]])
+
+
+def default_values(effect: str) -> np.ndarray:
+    """Get an effect's default numeric parameter values."""
+    return PARAM_TABLE["default"][_EFFECT_ROWS[effect]].copy()
+
+
+def clamp(effect: str, values) -> np.ndarray:
+    """
+    Clamp an effect's numeric parameter values to their valid ranges.
+
+    Args:
+        effect: Effect name (e.g. "Compressor")
+        values: One value per parameter, ordered as parameter_names(effect)
+
+    Returns:
+        The clamped values as a float32 array
+    """
+    rows = _EFFECT_ROWS[effect]
+    return np.clip(np.asarray(values, dtype=np.float32), PARAM_TABLE["min"][rows], PARAM_TABLE["max"][rows])
+
+
+def out_of_range(effect: str, values) -> np.ndarray:
+    """Get a boolean mask of the values outside their parameter's range."""
+    rows = _EFFECT_ROWS[effect]
+    values = np.asarray(values, dtype=np.float32)
+    return (values < PARAM_TABLE["min"][rows]) | (values > PARAM_TABLE["max"][rows])
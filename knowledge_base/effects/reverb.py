@@ -5,6 +5,8 @@ Comprehensive database of reverb and spatial effects including algorithmic rever
 convolution reverbs, and specialized spatial processors.
 """
 
+from ._frozen import build_specs
+
 REVERB_EFFECTS = {
     "Reverb": {
         "description": "High-quality algorithmic reverb with multiple room types",
@@ -82,4 +84,6 @@ REVERB_EFFECTS = {
         },
         "device_path": "Max for Live/Max Audio Effect/Convolution Reverb"
     }
-}
\ No newline at end of file
+}
+
+REVERB_EFFECTS = build_specs(REVERB_EFFECTS)
@@ -0,0 +1,45 @@
+"""
+Effect specification record shared by all effect categories.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Mapping, Tuple
+
+from .._records import DictAccess
+
+
+@dataclass(slots=True, frozen=True)
+class EffectSpec(DictAccess):
+    """Read-only description of one Ableton Live effect."""
+    
+    description: str
+    category: str
+    genres: Tuple[str, ...]
+    presets: Mapping
+    key_parameters: Mapping
+    usage_tips: Mapping
+    device_path: str
+
+
+@dataclass(slots=True, frozen=True)
+class NumParam(DictAccess):
+    """Numeric effect parameter: its range, default value and unit ("" if none)."""
+    
+    min: float
+    max: float
+    default: float
+    unit: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class EnumParam(DictAccess):
+    """Choice effect parameter: its options and default option."""
+    
+    options: Tuple[str, ...]
+    default: str
+
+
+for _record in (EffectSpec, NumParam, EnumParam):
+    _record._FIELDS = tuple(f.name for f in fields(_record))
+    _record._FIELD_NAMES = frozenset(_record._FIELDS)
+del _record
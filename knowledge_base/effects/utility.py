@@ -5,6 +5,8 @@ Comprehensive database of utility effects including gain, EQ, spectrum analyzer,
 and other mixing/mastering utilities.
 """
 
+from ._frozen import build_specs
+
 UTILITY_EFFECTS = {
     "Utility": {
         "description": "Essential mixing utility with gain, phase, stereo controls",
@@ -130,4 +132,6 @@ UTILITY_EFFECTS = {
         },
         "device_path": "Live/Limiter"
     }
-}
\ No newline at end of file
+}
+
+UTILITY_EFFECTS = build_specs(UTILITY_EFFECTS)
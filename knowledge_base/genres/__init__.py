@@ -8,13 +8,92 @@ and production techniques for each genre.
 Based on Beatport's genre categorization system.
 """
 
-from .techno import *
-from .house import *
-from .trance import *
-from .drum_and_bass import *
-from .dubstep import *
-from .ambient import *
-from .breakbeat import *
+import sys
+from functools import lru_cache
+from importlib import import_module
+from typing import Optional, Tuple
+
+from ._chord_codec import encode_progression
+from ._structures import section_range
+from ._util import share_tuples
+
+# Submodule -> the tables it defines. Submodules are only imported when one
+# of their tables is used, so e.g. reading GENRE_BPM_RANGES loads none of them.
+_GENRE_MODULES = {
+    "techno": (
+        "TECHNO_BPMS", "TECHNO_PROGRESSIONS", "INDUSTRIAL_ELEMENTS",
+        "SONG_STRUCTURES", "DRUM_PATTERNS", "DRUM_MASKS", "SCALES", "CHORD_TYPES",
+        "SONG_STRUCTURES_IDX"
+    ),
+    "house": (
+        "HOUSE_BPMS", "HOUSE_PROGRESSIONS", "HOUSE_CHARACTERISTICS", "HOUSE_DRUM_PATTERNS",
+        "HOUSE_DRUM_MASKS", "HOUSE_SCALES", "HOUSE_CHORD_TYPES", "HOUSE_SONG_STRUCTURES",
+        "HOUSE_INSTRUMENTS", "HOUSE_PRODUCTION_TECHNIQUES", "HOUSE_SONG_STRUCTURES_IDX"
+    ),
+    "trance": (
+        "TRANCE_BPMS", "TRANCE_PROGRESSIONS", "TRANCE_CHARACTERISTICS", "TRANCE_DRUM_PATTERNS",
+        "TRANCE_DRUM_MASKS", "TRANCE_REVERSED_MASKS",
+        "TRANCE_SCALES", "TRANCE_CHORD_TYPES", "TRANCE_SONG_STRUCTURES", "TRANCE_INSTRUMENTS",
+        "TRANCE_PRODUCTION_TECHNIQUES", "TRANCE_ENERGY_CURVES", "TRANCE_SONG_STRUCTURES_IDX"
+    ),
+    "drum_and_bass": (
+        "DNB_BPMS", "DNB_PROGRESSIONS", "DNB_CHARACTERISTICS", "DNB_DRUM_PATTERNS",
+        "DNB_DRUM_MASKS", "DNB_SCALES", "DNB_CHORD_TYPES", "DNB_CHORDS", "DNB_SONG_STRUCTURES",
+        "DNB_BASS_SOUNDS", "DNB_PRODUCTION_TECHNIQUES", "DNB_TEMPO_TECHNIQUES"
+    ),
+    "dubstep": (
+        "DUBSTEP_BPMS", "DUBSTEP_PROGRESSIONS", "DUBSTEP_CHARACTERISTICS",
+        "DUBSTEP_DRUM_PATTERNS", "DUBSTEP_DRUM_MASKS", "DUBSTEP_BASS_TYPES",
+        "DUBSTEP_BASS_TYPE_NAMES", "bass_types_with",
+        "DUBSTEP_SONG_STRUCTURES", "DUBSTEP_PRODUCTION_TECHNIQUES", "DUBSTEP_SCALES",
+        "DUBSTEP_CHORD_TYPES", "DUBSTEP_CHORDS", "DUBSTEP_DROP_TEMPLATES"
+    ),
+    "ambient": (
+        "AMBIENT_BPMS", "AMBIENT_PROGRESSIONS", "AMBIENT_CHARACTERISTICS",
+        "AMBIENT_SCALES", "AMBIENT_PRODUCTION_TECHNIQUES"
+    ),
+    "breakbeat": (
+        "BREAKBEAT_BPMS", "BREAKBEAT_PATTERNS", "BREAKBEAT_CHARACTERISTICS",
+        "BREAKBEAT_SCALES", "BREAKBEAT_PRODUCTION_TECHNIQUES"
+    )
+}
+
+_LAZY_ATTRIBUTES = {attr: module for module, attrs in _GENRE_MODULES.items() for attr in attrs}
+
+__all__ = [
+    *_LAZY_ATTRIBUTES,
+    "GENRES",
+    "GENRE_BPM_RANGES",
+    "characteristic",
+    "encoded_progressions_for",
+    "find_technique",
+    "genres_for_bpm",
+    "progressions_for",
+    "resolve_genre",
+    "section_range"
+]
+
+
+def __getattr__(name: str):
+    """Import the genre submodule defining ``name`` on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def _lazy(name: str):
+    """Look up a lazily loaded table from inside this module."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
 
 # Master genre registry
 GENRES = {
@@ -31,8 +110,41 @@ GENRES = {
     'big_beat': 'breakbeat'
 }
 
+_SEPARATORS = str.maketrans(" -", "__")
+
+
+def _canonical_genre(name: str) -> str:
+    """Spell a genre name like the GENRES keys ("Deep House" -> "deep_house")."""
+    return name.strip().lower().translate(_SEPARATORS)
+
+
+# Every accepted spelling -> GENRES key, so resolving is usually one lookup
+_GENRE_ALIASES = {"dnb": "drum_and_bass", "d&b": "drum_and_bass", "drum_&_bass": "drum_and_bass"}
+for _genre in GENRES:
+    for _alias in (_genre, _genre.replace("_", " "), _genre.replace("_", "-")):
+        _GENRE_ALIASES[_alias] = _genre
+        _GENRE_ALIASES[_alias.title()] = _genre
+del _genre, _alias
+
+
+def resolve_genre(name: str) -> Optional[str]:
+    """
+    Map a user-supplied genre name to its GENRES key.
+    
+    Args:
+        name: Genre name in any common spelling (e.g. "Deep House", "drum-and-bass")
+        
+    Returns:
+        The GENRES key (e.g. "deep_house"), or None if the genre is unknown
+    """
+    genre = _GENRE_ALIASES.get(name)
+    if genre is None:
+        genre = _GENRE_ALIASES.get(_canonical_genre(name))
+    return genre
+
+
 # Cross-genre BPM reference
-GENRE_BPM_RANGES = {
+GENRE_BPM_RANGES = share_tuples({
     'techno': (125, 150),
     'house': (120, 130),
     'deep_house': (118, 125),
@@ -44,4 +156,144 @@ GENRE_BPM_RANGES = {
     'ambient': (60, 120),
     'breakbeat': (120, 140),
     'big_beat': (120, 140)
-}
\ No newline at end of file
+})
+# Highest tempo covered by the BPM -> genres lookup table
+_MAX_BPM = 255
+
+
+def _build_bpm_index():
+    """Precompute, for every whole BPM, the genres whose range contains it."""
+    index = [[] for _ in range(_MAX_BPM + 1)]
+    for genre, (low, high) in GENRE_BPM_RANGES.items():
+        for bpm in range(max(low, 0), min(high, _MAX_BPM) + 1):
+            index[bpm].append(genre)
+    # Equal genre tuples share one object
+    shared = {}
+    return tuple(shared.setdefault(tuple(genres), tuple(genres)) for genres in index)
+
+
+_BPM_TO_GENRES = _build_bpm_index()
+
+
+def genres_for_bpm(bpm: float) -> Tuple[str, ...]:
+    """
+    Get the genres whose typical BPM range contains a tempo.
+    
+    Args:
+        bpm: Tempo in beats per minute
+        
+    Returns:
+        Matching genre names, in GENRE_BPM_RANGES order
+    """
+    if bpm == int(bpm) and 0 <= bpm <= _MAX_BPM:
+        return _BPM_TO_GENRES[int(bpm)]
+    return tuple(genre for genre, (low, high) in GENRE_BPM_RANGES.items() if low <= bpm <= high)
+
+
+# Genre module -> its chord progression table (breakbeat has none)
+_PROGRESSION_TABLES = {
+    "techno": "TECHNO_PROGRESSIONS",
+    "house": "HOUSE_PROGRESSIONS",
+    "trance": "TRANCE_PROGRESSIONS",
+    "drum_and_bass": "DNB_PROGRESSIONS",
+    "dubstep": "DUBSTEP_PROGRESSIONS",
+    "ambient": "AMBIENT_PROGRESSIONS"
+}
+
+
+@lru_cache(maxsize=256)
+def progressions_for(genre: str, key: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Get the chord progressions a genre uses in a key.
+    
+    Args:
+        genre: Genre or subgenre name (e.g. "deep_house" uses house's table)
+        key: Key name as used by the tables (e.g. "Am", "C")
+        
+    Returns:
+        The progressions as tuples of chord names (empty if none are known)
+    """
+    table = _PROGRESSION_TABLES.get(GENRES.get(genre, genre))
+    if table is None:
+        return ()
+    # The tables already hold tuples of shared chord tuples (see _util.freeze_progressions)
+    return _lazy(table).get(key, ())
+
+
+@lru_cache(maxsize=256)
+def encoded_progressions_for(genre: str, key: str) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Get progressions_for(genre, key) as integer chord codes (see _chord_codec).
+    
+    The codes transpose with _chord_codec.transpose() and turn back into
+    symbols with _chord_codec.decode().
+    """
+    return tuple(encode_progression(chords) for chords in progressions_for(genre, key))
+
+
+# Subgenre -> facet -> descriptions tables; subgenre names are unique across them
+_CHARACTERISTIC_TABLES = (
+    "HOUSE_CHARACTERISTICS",
+    "TRANCE_CHARACTERISTICS",
+    "DNB_CHARACTERISTICS",
+    "DUBSTEP_CHARACTERISTICS"
+)
+
+
+@lru_cache(maxsize=None)
+def _characteristic_index():
+    """Join the subgenre tables into one (subgenre, facet) -> descriptions map."""
+    return {
+        (subgenre, facet): tuple(sys.intern(value) for value in values)
+        for table in _CHARACTERISTIC_TABLES
+        for subgenre, facets in _lazy(table).items()
+        for facet, values in facets.items()
+    }
+
+
+def characteristic(subgenre: str, facet: str) -> Tuple[str, ...]:
+    """
+    Get one facet of a subgenre's characteristics with a single lookup.
+    
+    Args:
+        subgenre: Subgenre name (e.g. "neurofunk", "deep_house")
+        facet: "atmosphere", "instruments" or "production"
+        
+    Returns:
+        The descriptions (empty if the subgenre or facet is unknown)
+    """
+    return _characteristic_index().get((subgenre, facet), ())
+
+
+@lru_cache(maxsize=None)
+def _technique_index():
+    """Map each lowercased production technique to the (genre, category) buckets listing it."""
+    index = {}
+    for genre, attrs in _GENRE_MODULES.items():
+        for attr in attrs:
+            if attr.endswith("_PRODUCTION_TECHNIQUES"):
+                for category, techniques in _lazy(attr).items():
+                    for technique in techniques:
+                        index.setdefault(sys.intern(technique.lower()), []).append((genre, category))
+    return {technique: tuple(buckets) for technique, buckets in index.items()}
+
+
+def find_technique(technique: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Find which genres list a production technique.
+    
+    Args:
+        technique: Technique name or part of one (e.g. "side-chain compression")
+        
+    Returns:
+        (genre, category) pairs; an exact (case-insensitive) name is a single
+        lookup, anything else matches every technique containing it
+    """
+    index = _technique_index()
+    term = technique.lower()
+    buckets = index.get(term)
+    if buckets is not None:
+        return buckets
+    return tuple(dict.fromkeys(
+        bucket for name, name_buckets in index.items() if term in name for bucket in name_buckets
+    ))
@@ -0,0 +1,60 @@
+"""
+Integer chord codes for the genre progression tables.
+
+A chord symbol ("Am7", "F#m", "BbM7") is encoded once as
+``root_pitch_class | quality_id << 4``. Transposing then only touches the
+low four bits, and the symbol is rebuilt from lookup tables.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, Tuple
+
+_ROOTS = {
+    "C": 0, "B#": 0, "C#": 1, "Db": 1, "D": 2, "D#": 3, "Eb": 3, "E": 4, "Fb": 4,
+    "F": 5, "E#": 5, "F#": 6, "Gb": 6, "G": 7, "G#": 8, "Ab": 8, "A": 9,
+    "A#": 10, "Bb": 10, "B": 11, "Cb": 11
+}
+
+# Spelling used when decoding (matches the roots the genre tables use)
+_ROOT_NAMES = ("C", "C#", "D", "Eb", "E", "F", "F#", "G", "Ab", "A", "Bb", "B")
+
+# Quality suffixes; a chord's quality id is its index here
+QUALITIES = ("", "m", "7", "M7", "m7", "9", "M9", "m9", "dim", "aug", "sus2", "sus4", "add9")
+_QUALITY_IDS = {quality: i for i, quality in enumerate(QUALITIES)}
+
+_ROOT_MASK = 0xF
+_SYMBOL = re.compile(r"([A-G][b#]?)(.*)")
+
+
+@lru_cache(maxsize=None)
+def encode(symbol: str) -> int:
+    """
+    Encode a chord symbol as an int.
+    
+    Raises:
+        ValueError: The root or quality is not recognised
+    """
+    match = _SYMBOL.fullmatch(symbol)
+    if match is None or match.group(2) not in _QUALITY_IDS:
+        raise ValueError(f"Unknown chord symbol: {symbol!r}")
+    root, quality = match.groups()
+    return _ROOTS[root] | _QUALITY_IDS[quality] << 4
+
+
+def decode(code: int) -> str:
+    """Turn a chord code back into its symbol."""
+    return _ROOT_NAMES[code & _ROOT_MASK] + QUALITIES[code >> 4]
+
+
+def encode_progression(symbols: Iterable[str]) -> Tuple[int, ...]:
+    """Encode a progression of chord symbols."""
+    return tuple(encode(symbol) for symbol in symbols)
+
+
+def transpose(codes: Iterable[int], semitones: int) -> Tuple[int, ...]:
+    """Shift every chord root of a progression by ``semitones`` (qualities are kept)."""
+    return tuple(
+        ((code & _ROOT_MASK) + semitones) % 12 | (code & ~_ROOT_MASK)
+        for code in codes
+    )
@@ -0,0 +1,38 @@
+"""
+Chord interval templates packed into one contiguous buffer.
+"""
+
+from array import array
+from collections.abc import Mapping
+
+
+class PackedChords(Mapping):
+    """
+    Read-only chord name -> intervals mapping backed by a single array('b').
+    
+    All templates share one signed-byte buffer; a lookup is a dict probe
+    for the row plus a zero-copy memoryview slice of the buffer.
+    """
+    
+    def __init__(self, chord_types: dict):
+        """
+        Args:
+            chord_types: Chord name -> semitone intervals (e.g. DNB_CHORD_TYPES)
+        """
+        self.buffer = array("b")
+        self._rows = {}
+        for name, intervals in chord_types.items():
+            start = len(self.buffer)
+            self.buffer.extend(intervals)
+            self._rows[name] = (start, len(self.buffer))
+        self._view = memoryview(self.buffer).toreadonly()
+    
+    def __getitem__(self, name: str) -> memoryview:
+        start, end = self._rows[name]
+        return self._view[start:end]
+    
+    def __iter__(self):
+        return iter(self._rows)
+    
+    def __len__(self):
+        return len(self._rows)
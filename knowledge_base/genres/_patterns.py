@@ -0,0 +1,66 @@
+"""
+Step pattern helpers for the genre drum tables.
+
+A 16-step pattern string ("X..X.X.XX.X.X..X") packs into a 16-bit mask with
+step 0 in the most significant bit, so the mask reads like the string.
+Trance marks reversed snares with "R"; those steps go in a second mask.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+STEPS = 16
+
+_STEP_CHARS = frozenset("X.R")
+
+# One mask per distinct (pattern, hit) across all genre tables
+_MASKS: Dict[Tuple[str, str], int] = {}
+
+
+def pattern_mask(pattern: str, hit: str = "X") -> int:
+    """
+    Pack a step pattern string into a 16-bit mask.
+
+    Args:
+        pattern: One character per step, "X" for a hit, "R" for a reversed
+            hit and "." for a rest
+        hit: The step character to set bits for
+
+    Returns:
+        The mask, with step 0 in bit 15; equal patterns in any table get
+        the same int object
+
+    Raises:
+        ValueError: The pattern is not 16 steps of "X"/"R"/"."
+    """
+    mask = _MASKS.get((pattern, hit))
+    if mask is None:
+        if len(pattern) != STEPS or not _STEP_CHARS.issuperset(pattern):
+            raise ValueError(f"Pattern must have {STEPS} steps of X, R or '.': {pattern!r}")
+        mask = int("".join("1" if step == hit else "0" for step in pattern), 2)
+        _MASKS[(pattern, hit)] = mask
+    return mask
+
+
+def hits_mask(hits) -> int:
+    """Pack hit step indices (e.g. [0, 3, 9, 14]) into a 16-bit mask."""
+    mask = 0
+    for step in hits:
+        mask |= 1 << (STEPS - 1 - step)
+    return mask
+
+
+def hit_count(mask: int) -> int:
+    """Count the hits in a mask."""
+    return mask.bit_count()
+
+
+def is_hit(mask: int, step: int) -> bool:
+    """Check whether a mask has a hit on a step."""
+    return bool(mask >> (STEPS - 1 - step) & 1)
+
+
+@lru_cache(maxsize=None)
+def mask_hits(mask: int) -> Tuple[int, ...]:
+    """Get the hit step indices of a mask, in step order."""
+    return tuple(step for step in range(STEPS) if mask >> (STEPS - 1 - step) & 1)
@@ -0,0 +1,58 @@
+"""
+Scale interval tuples shared by the genre modules.
+
+Each scale is defined once, so every genre table listing e.g. dorian
+references the same immutable object. The *_MASK constants hold the same
+scales as 12-bit pitch-class sets, where membership is a shift and a
+mask, and scales common to two masks are ``a & b``.
+"""
+
+MAJOR = (0, 2, 4, 5, 7, 9, 11)
+NATURAL_MINOR = (0, 2, 3, 5, 7, 8, 10)
+HARMONIC_MINOR = (0, 2, 3, 5, 7, 8, 11)
+HUNGARIAN_MINOR = (0, 2, 3, 6, 7, 8, 11)
+DORIAN = (0, 2, 3, 5, 7, 9, 10)
+PHRYGIAN = (0, 1, 3, 5, 7, 8, 10)
+MIXOLYDIAN = (0, 2, 4, 5, 7, 9, 10)
+MAJOR_PENTATONIC = (0, 2, 4, 7, 9)
+MINOR_PENTATONIC = (0, 3, 5, 7, 10)
+BLUES = (0, 3, 5, 6, 7, 10)
+WHOLE_TONE = (0, 2, 4, 6, 8, 10)
+CHROMATIC = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11)
+
+
+# Pitch-class set masks: bit n is set when the scale contains semitone n
+_PITCH_CLASSES = 0xFFF
+
+
+def scale_mask(scale) -> int:
+    """Pack a scale's semitone offsets into a 12-bit pitch-class mask."""
+    mask = 0
+    for semitone in scale:
+        mask |= 1 << semitone % 12
+    return mask
+
+
+MAJOR_MASK = scale_mask(MAJOR)
+NATURAL_MINOR_MASK = scale_mask(NATURAL_MINOR)
+HARMONIC_MINOR_MASK = scale_mask(HARMONIC_MINOR)
+HUNGARIAN_MINOR_MASK = scale_mask(HUNGARIAN_MINOR)
+DORIAN_MASK = scale_mask(DORIAN)
+PHRYGIAN_MASK = scale_mask(PHRYGIAN)
+MIXOLYDIAN_MASK = scale_mask(MIXOLYDIAN)
+MAJOR_PENTATONIC_MASK = scale_mask(MAJOR_PENTATONIC)
+MINOR_PENTATONIC_MASK = scale_mask(MINOR_PENTATONIC)
+BLUES_MASK = scale_mask(BLUES)
+WHOLE_TONE_MASK = scale_mask(WHOLE_TONE)
+CHROMATIC_MASK = scale_mask(CHROMATIC)
+
+
+def in_scale(mask: int, semitone: int) -> bool:
+    """Check whether a semitone offset from the root (any octave) is in a scale mask."""
+    return bool(mask >> semitone % 12 & 1)
+
+
+def transpose_mask(mask: int, semitones: int) -> int:
+    """Rotate a scale mask to a new root, e.g. C minor -> D minor with semitones=2."""
+    semitones %= 12
+    return (mask << semitones | mask >> (12 - semitones)) & _PITCH_CLASSES
@@ -0,0 +1,85 @@
+"""
+Fixed-schema song structure records for the genre arrangement tables.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Tuple
+
+
+@dataclass(slots=True, frozen=True)
+class SongStructure(Mapping):
+    """
+    An arrangement: (section, bars) pairs in playing order.
+    
+    Also a read-only section -> bars mapping, so it can be used wherever
+    the {section: bars} dict it replaced was.
+    """
+    
+    sections: Tuple[Tuple[str, int], ...]
+    total_bars: int = field(init=False)
+    # Bar each section starts at, aligned with sections
+    starts: Tuple[int, ...] = field(init=False)
+    _positions: Mapping[str, int] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        starts = []
+        total = 0
+        for _, bars in self.sections:
+            starts.append(total)
+            total += bars
+        object.__setattr__(self, "total_bars", total)
+        object.__setattr__(self, "starts", tuple(starts))
+        positions = MappingProxyType({name: i for i, (name, _) in enumerate(self.sections)})
+        object.__setattr__(self, "_positions", positions)
+    
+    def __getitem__(self, section: str) -> int:
+        """Bars of a section (structure["intro"])."""
+        return self.sections[self._positions[section]][1]
+    
+    def __iter__(self):
+        return iter(self._positions)
+    
+    def __len__(self):
+        return len(self.sections)
+    
+    def __contains__(self, section) -> bool:
+        return section in self._positions
+    
+    def section_range(self, section: str) -> Tuple[int, int]:
+        """
+        Get the bars a section spans.
+        
+        Returns:
+            (start bar, end bar), end exclusive
+        
+        Raises:
+            KeyError: The arrangement has no such section
+        """
+        i = self._positions[section]
+        start = self.starts[i]
+        return start, start + self.sections[i][1]
+    
+    def items(self) -> Tuple[Tuple[str, int], ...]:
+        """The (section, bars) pairs in playing order (the sections tuple itself)."""
+        return self.sections
+
+
+def song_structures(table: Dict[str, Dict[str, int]]) -> Dict[str, SongStructure]:
+    """Convert a name -> {section: bars} table into SongStructure records."""
+    return {name: SongStructure(tuple(sections.items())) for name, sections in table.items()}
+
+
+def section_range(structure: SongStructure, section: str) -> Tuple[int, int]:
+    """
+    Get the bars a section of an indexed structure spans.
+    
+    Args:
+        structure: A precomputed structure (e.g. HOUSE_SONG_STRUCTURES_IDX["classic"])
+        section: Section name (e.g. "drop")
+        
+    Returns:
+        (start bar, end bar), end exclusive
+    """
+    return structure.section_range(section)
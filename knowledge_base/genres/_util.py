@@ -0,0 +1,56 @@
+"""
+Helpers for the read-only genre catalog tables.
+"""
+
+import sys
+
+
+def freeze_strings(table: dict) -> dict:
+    """
+    Turn every list of strings in a (nested) table into a tuple of interned strings.
+    
+    Phrases repeated across subgenres then share one object, and the
+    catalog entries can't be mutated in place or used as cache keys by
+    mistake. Plain string values (e.g. drum step patterns) are interned too.
+    """
+    for key, value in table.items():
+        if isinstance(value, dict):
+            freeze_strings(value)
+        elif isinstance(value, str):
+            table[key] = sys.intern(value)
+        elif isinstance(value, list) and all(isinstance(item, str) for item in value):
+            table[key] = tuple(sys.intern(item) for item in value)
+    return table
+
+
+# One shared tuple per distinct value (e.g. the (120, 140) BPM range)
+_TUPLES = {}
+
+
+def share_tuples(table: dict) -> dict:
+    """
+    Replace each tuple value with the shared tuple of equal value, in place.
+    
+    The compiler already merges equal tuple constants within one module;
+    this extends the sharing across the genre modules.
+    """
+    for key, value in table.items():
+        if isinstance(value, tuple):
+            table[key] = _TUPLES.setdefault(value, value)
+    return table
+
+
+def freeze_progressions(table: dict) -> dict:
+    """
+    Turn each key's list of chord progressions into a tuple of shared tuples, in place.
+    
+    Chord symbols are interned, and a progression listed under several keys
+    or genres (e.g. Am-F-C-G) becomes one tuple object.
+    """
+    for key, progressions in table.items():
+        frozen = []
+        for progression in progressions:
+            chords = tuple(sys.intern(chord) for chord in progression)
+            frozen.append(_TUPLES.setdefault(chords, chords))
+        table[key] = tuple(frozen)
+    return table
@@ -3,8 +3,16 @@ Ambient Music Genre Knowledge Base
 Based on ambient and downtempo characteristics
 """
 
+from ._scales import MAJOR, NATURAL_MINOR, DORIAN, MIXOLYDIAN, MAJOR_PENTATONIC, WHOLE_TONE
+from ._util import freeze_progressions, freeze_strings, share_tuples
+
+__all__ = [
+    "AMBIENT_BPMS", "AMBIENT_PROGRESSIONS", "AMBIENT_CHARACTERISTICS", "AMBIENT_SCALES",
+    "AMBIENT_PRODUCTION_TECHNIQUES"
+]
+
 # Ambient BPM ranges by subgenre
-AMBIENT_BPMS = {
+AMBIENT_BPMS = share_tuples({
     "ambient": (60, 100),
     "dark_ambient": (60, 90),
     "drone": (50, 80),
@@ -13,10 +21,10 @@ AMBIENT_BPMS = {
     "downtempo": (80, 110),
     "trip_hop": (85, 115),
     "lofi": (70, 95)
-}
+})
 
 # Ambient chord progressions (extended and atmospheric)
-AMBIENT_PROGRESSIONS = {
+AMBIENT_PROGRESSIONS = freeze_progressions({
     "C": [
         ["CM7", "Am7", "FM7", "GM7"],    # Smooth jazz progression
         ["C", "F", "Am", "G"],          # Simple and open
@@ -29,10 +37,10 @@ AMBIENT_PROGRESSIONS = {
         ["Am9", "FM9", "CM9", "GM9"],   # Extended harmony
         ["Am", "Em", "F", "C"]          # Natural minor
     ]
-}
+})
 
 # Ambient characteristics
-AMBIENT_CHARACTERISTICS = {
+AMBIENT_CHARACTERISTICS = freeze_strings({
     "atmosphere": [
         "Spacious and ethereal",
         "Meditative and calming",
@@ -54,20 +62,20 @@ AMBIENT_CHARACTERISTICS = {
         "Slow parameter automation",
         "Organic movement"
     ]
-}
+})
 
 # Ambient scales
 AMBIENT_SCALES = {
-    "major": [0, 2, 4, 5, 7, 9, 11],
-    "minor": [0, 2, 3, 5, 7, 8, 10],
-    "dorian": [0, 2, 3, 5, 7, 9, 10],
-    "mixolydian": [0, 2, 4, 5, 7, 9, 10],
-    "pentatonic": [0, 2, 4, 7, 9],
-    "whole_tone": [0, 2, 4, 6, 8, 10]
+    "major": MAJOR,
+    "minor": NATURAL_MINOR,
+    "dorian": DORIAN,
+    "mixolydian": MIXOLYDIAN,
+    "pentatonic": MAJOR_PENTATONIC,
+    "whole_tone": WHOLE_TONE
 }
 
 # Ambient production techniques
-AMBIENT_PRODUCTION_TECHNIQUES = {
+AMBIENT_PRODUCTION_TECHNIQUES = freeze_strings({
     "texture_creation": [
         "Granular synthesis",
         "Reverse reverb",
@@ -82,4 +90,4 @@ AMBIENT_PRODUCTION_TECHNIQUES = {
         "Subtle layering",
         "Natural dynamics"
     ]
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -3,8 +3,16 @@ Breakbeat Genre Knowledge Base
 Based on breakbeat and big beat characteristics
 """
 
+from ._scales import NATURAL_MINOR, DORIAN, MINOR_PENTATONIC, BLUES
+from ._util import freeze_strings, share_tuples
+
+__all__ = [
+    "BREAKBEAT_BPMS", "BREAKBEAT_PATTERNS", "BREAKBEAT_CHARACTERISTICS",
+    "BREAKBEAT_SCALES", "BREAKBEAT_PRODUCTION_TECHNIQUES"
+]
+
 # Breakbeat BPM ranges by subgenre
-BREAKBEAT_BPMS = {
+BREAKBEAT_BPMS = share_tuples({
     "big_beat": (120, 140),
     "nu_skool_breaks": (125, 135),
     "progressive_breaks": (128, 138),
@@ -12,7 +20,7 @@ BREAKBEAT_BPMS = {
     "acid_breaks": (125, 140),
     "jungle_breaks": (160, 180),
     "breakcore": (150, 200)
-}
+})
 
 # Common breakbeat patterns (classic breaks)
 BREAKBEAT_PATTERNS = {
@@ -23,7 +31,7 @@ BREAKBEAT_PATTERNS = {
 }
 
 # Breakbeat characteristics
-BREAKBEAT_CHARACTERISTICS = {
+BREAKBEAT_CHARACTERISTICS = freeze_strings({
     "atmosphere": [
         "Funky and groovy",
         "Hip-hop influenced",
@@ -45,18 +53,18 @@ BREAKBEAT_CHARACTERISTICS = {
         "Turntable techniques",
         "Hip-hop influence"
     ]
-}
+})
 
 # Breakbeat scales
 BREAKBEAT_SCALES = {
-    "minor_pentatonic": [0, 3, 5, 7, 10],
-    "blues_scale": [0, 3, 5, 6, 7, 10],
-    "natural_minor": [0, 2, 3, 5, 7, 8, 10],
-    "dorian": [0, 2, 3, 5, 7, 9, 10]
+    "minor_pentatonic": MINOR_PENTATONIC,
+    "blues_scale": BLUES,
+    "natural_minor": NATURAL_MINOR,
+    "dorian": DORIAN
 }
 
 # Production techniques
-BREAKBEAT_PRODUCTION_TECHNIQUES = {
+BREAKBEAT_PRODUCTION_TECHNIQUES = freeze_strings({
     "break_manipulation": [
         "Time-stretching",
         "Chopping and rearranging",
@@ -71,4 +79,4 @@ BREAKBEAT_PRODUCTION_TECHNIQUES = {
         "Instrumental loops",
         "One-shot samples"
     ]
-}
\ No newline at end of file
+})
\ No newline at end of file
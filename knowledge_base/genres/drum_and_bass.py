@@ -3,8 +3,20 @@ Drum & Bass Genre Knowledge Base
 Based on Beatport categorization and D&B characteristics
 """
 
+from ._chords import PackedChords
+from ._patterns import pattern_mask
+from ._scales import NATURAL_MINOR, DORIAN, MIXOLYDIAN, MINOR_PENTATONIC, BLUES, CHROMATIC
+from ._structures import song_structures
+from ._util import freeze_progressions, share_tuples
+
+__all__ = [
+    "DNB_BPMS", "DNB_PROGRESSIONS", "DNB_CHARACTERISTICS", "DNB_DRUM_PATTERNS",
+    "DNB_DRUM_MASKS", "DNB_SCALES", "DNB_CHORD_TYPES", "DNB_CHORDS", "DNB_SONG_STRUCTURES",
+    "DNB_BASS_SOUNDS", "DNB_PRODUCTION_TECHNIQUES", "DNB_TEMPO_TECHNIQUES"
+]
+
 # Drum & Bass BPM ranges by subgenre
-DNB_BPMS = {
+DNB_BPMS = share_tuples({
     "liquid_dnb": (168, 176),
     "neurofunk": (170, 180),
     "jump_up": (172, 178),
@@ -13,10 +25,10 @@ DNB_BPMS = {
     "hardstep": (174, 180),
     "tech_dnb": (170, 176),
     "ambient_dnb": (160, 170)
-}
+})
 
 # Common chord progressions for D&B (often jazz-influenced)
-DNB_PROGRESSIONS = {
+DNB_PROGRESSIONS = freeze_progressions({
     "Am": [
         ["Am", "Dm7", "G7", "CM7"],    # Jazz ii-V-I in C
         ["Am7", "F", "C", "G"],        # Smooth progression
@@ -36,7 +48,7 @@ DNB_PROGRESSIONS = {
         ["Em7", "Am7", "D7", "GM7"],   # ii-V in G
         ["Em", "Bm", "C", "G"]         # Modal Em progression
     ]
-}
+})
 
 # D&B characteristics by subgenre
 DNB_CHARACTERISTICS = {
@@ -135,32 +147,40 @@ DNB_DRUM_PATTERNS = {
     }
 }
 
+# Each D&B pattern packed into a 16-bit step mask (see _patterns)
+DNB_DRUM_MASKS = {
+    name: pattern_mask(pattern["pattern"]) for name, pattern in DNB_DRUM_PATTERNS.items()
+}
+
 # D&B specific scales (jazz-influenced)
 DNB_SCALES = {
-    "natural_minor": [0, 2, 3, 5, 7, 8, 10],
-    "dorian": [0, 2, 3, 5, 7, 9, 10],        # Very common in D&B
-    "minor_pentatonic": [0, 3, 5, 7, 10],     # Simple melodies
-    "blues_scale": [0, 3, 5, 6, 7, 10],       # Bluesy flavor
-    "mixolydian": [0, 2, 4, 5, 7, 9, 10],     # Dominant sound
-    "chromatic": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]  # Full chromatic
+    "natural_minor": NATURAL_MINOR,
+    "dorian": DORIAN,                      # Very common in D&B
+    "minor_pentatonic": MINOR_PENTATONIC,  # Simple melodies
+    "blues_scale": BLUES,                  # Bluesy flavor
+    "mixolydian": MIXOLYDIAN,              # Dominant sound
+    "chromatic": CHROMATIC                 # Full chromatic
 }
 
 # D&B chord types (often extended jazz chords)
-DNB_CHORD_TYPES = {
-    "minor7": [0, 3, 7, 10],          # Most common in D&B
-    "major7": [0, 4, 7, 11],          # Jazz influence
-    "dominant7": [0, 4, 7, 10],       # Blues/jazz sound
-    "minor9": [0, 3, 7, 10, 14],      # Extended minor
-    "major9": [0, 4, 7, 11, 14],      # Extended major
-    "sus2": [0, 2, 7],                # Open sound
-    "sus4": [0, 5, 7],                # Tension
-    "dim7": [0, 3, 6, 9],            # Diminished tension
-    "half_dim7": [0, 3, 6, 10],       # Jazz chord
-    "add9": [0, 4, 7, 14]             # Added ninth
-}
+DNB_CHORD_TYPES = share_tuples({
+    "minor7": (0, 3, 7, 10),          # Most common in D&B
+    "major7": (0, 4, 7, 11),          # Jazz influence
+    "dominant7": (0, 4, 7, 10),       # Blues/jazz sound
+    "minor9": (0, 3, 7, 10, 14),      # Extended minor
+    "major9": (0, 4, 7, 11, 14),      # Extended major
+    "sus2": (0, 2, 7),                # Open sound
+    "sus4": (0, 5, 7),                # Tension
+    "dim7": (0, 3, 6, 9),            # Diminished tension
+    "half_dim7": (0, 3, 6, 10),       # Jazz chord
+    "add9": (0, 4, 7, 14)             # Added ninth
+})
+
+# The same chord templates packed into one contiguous buffer (see _chords)
+DNB_CHORDS = PackedChords(DNB_CHORD_TYPES)
 
 # D&B song structures (typically longer builds)
-DNB_SONG_STRUCTURES = {
+DNB_SONG_STRUCTURES = song_structures({
     "classic": {      # 128-160 bars
         "intro": 32,
         "buildup": 32,
@@ -184,7 +204,7 @@ DNB_SONG_STRUCTURES = {
         "drop2": 64,
         "outro": 16
     }
-}
+})
 
 # Bass sound types in D&B
 DNB_BASS_SOUNDS = {
@@ -269,4 +289,4 @@ DNB_TEMPO_TECHNIQUES = {
         "description": "Tempo switches within the track",
         "common_switches": ["170->85->170", "174->87->174"]
     }
-}
\ No newline at end of file
+}
@@ -3,8 +3,24 @@ Dubstep Genre Knowledge Base
 Based on Beatport categorization and dubstep characteristics
 """
 
+from ._chords import PackedChords
+from ._patterns import pattern_mask
+from ._scales import (
+    NATURAL_MINOR, HARMONIC_MINOR, DORIAN, PHRYGIAN, MINOR_PENTATONIC, BLUES, CHROMATIC
+)
+from ._structures import song_structures
+from ._util import freeze_progressions, freeze_strings, share_tuples
+
+__all__ = [
+    "DUBSTEP_BPMS", "DUBSTEP_PROGRESSIONS", "DUBSTEP_CHARACTERISTICS",
+    "DUBSTEP_DRUM_PATTERNS", "DUBSTEP_DRUM_MASKS", "DUBSTEP_BASS_TYPES",
+    "DUBSTEP_BASS_TYPE_NAMES", "bass_types_with",
+    "DUBSTEP_SONG_STRUCTURES", "DUBSTEP_PRODUCTION_TECHNIQUES", "DUBSTEP_SCALES",
+    "DUBSTEP_CHORD_TYPES", "DUBSTEP_CHORDS", "DUBSTEP_DROP_TEMPLATES"
+]
+
 # Dubstep BPM ranges by subgenre
-DUBSTEP_BPMS = {
+DUBSTEP_BPMS = share_tuples({
     "classic_dubstep": (138, 142),
     "brostep": (140, 145),
     "future_garage": (130, 140),
@@ -13,10 +29,10 @@ DUBSTEP_BPMS = {
     "chillstep": (120, 140),
     "dubstyle": (140, 150),
     "trapstep": (140, 160)
-}
+})
 
 # Dubstep chord progressions (often minor and dramatic)
-DUBSTEP_PROGRESSIONS = {
+DUBSTEP_PROGRESSIONS = freeze_progressions({
     "Em": [
         ["Em", "C", "G", "D"],          # Epic progression
         ["Em", "Am", "C", "G"],         # Emotional build
@@ -43,10 +59,10 @@ DUBSTEP_PROGRESSIONS = {
         ["Dm", "C", "Bb", "A"],         # Dominant resolution
         ["Dm", "F", "Bb", "C"]          # Uplifting minor
     ]
-}
+})
 
 # Dubstep characteristics by subgenre
-DUBSTEP_CHARACTERISTICS = {
+DUBSTEP_CHARACTERISTICS = freeze_strings({
     "classic_dubstep": {
         "atmosphere": [
             "Dark and underground",
@@ -116,10 +132,10 @@ DUBSTEP_CHARACTERISTICS = {
             "Smooth transitions"
         ]
     }
-}
+})
 
 # Dubstep drum patterns (halfstep focus)
-DUBSTEP_DRUM_PATTERNS = {
+DUBSTEP_DRUM_PATTERNS = freeze_strings({
     "classic_halfstep": {
         "kick": "X.......X.......",      # Halfstep kick pattern
         "snare": "........X.......",     # Snare on 3
@@ -144,10 +160,16 @@ DUBSTEP_DRUM_PATTERNS = {
         "hihat": "X.X.X.X.X.X.X.X.",     # Driving hats
         "perc": "..X...X...X...X."      # Riddim percussion
     }
+})
+
+# Each dubstep pattern's lanes packed into 16-bit step masks (see _patterns)
+DUBSTEP_DRUM_MASKS = {
+    name: {lane: pattern_mask(steps) for lane, steps in lanes.items()}
+    for name, lanes in DUBSTEP_DRUM_PATTERNS.items()
 }
 
 # Dubstep bass design types
-DUBSTEP_BASS_TYPES = {
+DUBSTEP_BASS_TYPES = freeze_strings({
     "wobble_bass": {
         "characteristics": ["LFO modulated filter", "Sawtooth wave base", "Low-pass filtering"],
         "modulation_rates": ["1/4 note", "1/8 note", "1/16 note", "Triplets"],
@@ -165,10 +187,51 @@ DUBSTEP_BASS_TYPES = {
         "characteristics": ["Distorted and aggressive", "Formant filtering", "Vocal-like qualities"],
         "techniques": ["Vocal formants", "Distortion chaining", "Dynamic filtering"]
     }
-}
+})
+
+# Packed view of DUBSTEP_BASS_TYPES: every descriptor (characteristic,
+# technique, filter type, ...) gets one bit; each bass type's mask has the
+# bits of all its descriptors, aligned with DUBSTEP_BASS_TYPE_NAMES.
+DUBSTEP_BASS_TYPE_NAMES = tuple(DUBSTEP_BASS_TYPES)
+_BASS_DESCRIPTOR_BITS = {}
+for _attributes in DUBSTEP_BASS_TYPES.values():
+    for _values in _attributes.values():
+        for _value in _values:
+            _BASS_DESCRIPTOR_BITS.setdefault(_value.lower(), 1 << len(_BASS_DESCRIPTOR_BITS))
+_BASS_TYPE_MASKS = tuple(
+    sum({
+        _BASS_DESCRIPTOR_BITS[value.lower()]
+        for values in attributes.values() for value in values
+    })
+    for attributes in DUBSTEP_BASS_TYPES.values()
+)
+del _attributes, _values, _value
+
+
+def bass_types_with(*descriptors: str) -> tuple:
+    """
+    Find the bass types listing all of the given descriptors (case-insensitive).
+    
+    Args:
+        descriptors: e.g. "Notch", "Side-chain to kick"
+        
+    Returns:
+        Matching DUBSTEP_BASS_TYPES names (empty if any descriptor is unknown)
+    """
+    wanted = 0
+    for descriptor in descriptors:
+        bit = _BASS_DESCRIPTOR_BITS.get(descriptor.lower())
+        if bit is None:
+            return ()
+        wanted |= bit
+    return tuple(
+        name for name, mask in zip(DUBSTEP_BASS_TYPE_NAMES, _BASS_TYPE_MASKS)
+        if mask & wanted == wanted
+    )
+
 
 # Dubstep song structures
-DUBSTEP_SONG_STRUCTURES = {
+DUBSTEP_SONG_STRUCTURES = song_structures({
     "classic": {          # Standard dubstep structure
         "intro": 32,
         "verse": 32,
@@ -198,10 +261,10 @@ DUBSTEP_SONG_STRUCTURES = {
         "final_chorus": 32,
         "outro": 16
     }
-}
+})
 
 # Dubstep production techniques
-DUBSTEP_PRODUCTION_TECHNIQUES = {
+DUBSTEP_PRODUCTION_TECHNIQUES = freeze_strings({
     "bass_design": [
         "LFO modulation on filters",
         "Distortion and saturation",
@@ -237,32 +300,35 @@ DUBSTEP_PRODUCTION_TECHNIQUES = {
         "Filtering for movement",
         "Gating and chopping"
     ]
-}
+})
 
 # Dubstep scales (often dark and minor)
 DUBSTEP_SCALES = {
-    "natural_minor": [0, 2, 3, 5, 7, 8, 10],     # Most common
-    "harmonic_minor": [0, 2, 3, 5, 7, 8, 11],    # Dramatic sound
-    "dorian": [0, 2, 3, 5, 7, 9, 10],            # Slightly brighter minor
-    "phrygian": [0, 1, 3, 5, 7, 8, 10],          # Dark and exotic
-    "minor_pentatonic": [0, 3, 5, 7, 10],         # Simple and effective
-    "blues_scale": [0, 3, 5, 6, 7, 10],           # Bluesy edge
-    "chromatic": [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]  # Full chromatic
+    "natural_minor": NATURAL_MINOR,        # Most common
+    "harmonic_minor": HARMONIC_MINOR,      # Dramatic sound
+    "dorian": DORIAN,                      # Slightly brighter minor
+    "phrygian": PHRYGIAN,                  # Dark and exotic
+    "minor_pentatonic": MINOR_PENTATONIC,  # Simple and effective
+    "blues_scale": BLUES,                  # Bluesy edge
+    "chromatic": CHROMATIC                 # Full chromatic
 }
 
 # Dubstep chord types
-DUBSTEP_CHORD_TYPES = {
-    "minor": [0, 3, 7],           # Basic minor
-    "major": [0, 4, 7],           # Basic major  
-    "sus2": [0, 2, 7],            # Open sound
-    "sus4": [0, 5, 7],            # Tension
-    "minor7": [0, 3, 7, 10],      # Minor seventh
-    "major7": [0, 4, 7, 11],      # Major seventh
-    "add9": [0, 4, 7, 14],        # Added ninth
-    "power": [0, 7],              # Power chord
-    "diminished": [0, 3, 6],      # Diminished tension
-    "augmented": [0, 4, 8]        # Augmented tension
-}
+DUBSTEP_CHORD_TYPES = share_tuples({
+    "minor": (0, 3, 7),           # Basic minor
+    "major": (0, 4, 7),           # Basic major  
+    "sus2": (0, 2, 7),            # Open sound
+    "sus4": (0, 5, 7),            # Tension
+    "minor7": (0, 3, 7, 10),      # Minor seventh
+    "major7": (0, 4, 7, 11),      # Major seventh
+    "add9": (0, 4, 7, 14),        # Added ninth
+    "power": (0, 7),              # Power chord
+    "diminished": (0, 3, 6),      # Diminished tension
+    "augmented": (0, 4, 8)        # Augmented tension
+})
+
+# The same chord templates packed into one contiguous buffer (see _chords)
+DUBSTEP_CHORDS = PackedChords(DUBSTEP_CHORD_TYPES)
 
 # Drop design templates
 DUBSTEP_DROP_TEMPLATES = {
@@ -287,4 +353,4 @@ DUBSTEP_DROP_TEMPLATES = {
         "bar_4": "Full riddim groove",
         "repeat": "Vary bass modulation"
     }
-}
\ No newline at end of file
+}
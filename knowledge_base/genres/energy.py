@@ -0,0 +1,55 @@
+"""
+Vectorized Energy Curves
+
+TRANCE_ENERGY_CURVES as read-only (point, [bar, energy]) int16 NumPy
+arrays, plus each curve linearly interpolated at every bar, so energy
+at any bar position is one np.interp call and energy at a whole bar is
+an index. Requires NumPy.
+"""
+
+from typing import Dict
+
+import numpy as np
+
+from .trance import TRANCE_ENERGY_CURVES
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+# Curve name -> (point, 2) array of (bar, energy) breakpoints
+ENERGY_CURVES: Dict[str, np.ndarray] = {
+    name: _read_only(np.array(points, dtype=np.int16))
+    for name, points in TRANCE_ENERGY_CURVES.items()
+}
+
+# Curve name -> energy at bars 0 .. the curve's last breakpoint
+_PER_BAR: Dict[str, np.ndarray] = {
+    name: _read_only(
+        np.interp(np.arange(curve[-1, 0] + 1), curve[:, 0], curve[:, 1]).astype(np.float32)
+    )
+    for name, curve in ENERGY_CURVES.items()
+}
+
+
+def energy_at(curve_name: str, bars) -> np.ndarray:
+    """
+    Interpolate a curve's energy at bar positions.
+
+    Args:
+        curve_name: TRANCE_ENERGY_CURVES name (e.g. "uplifting")
+        bars: Bar positions, fractional values allowed; positions past
+            either end get the end point's energy
+
+    Returns:
+        The energies (0-100) as a float64 array
+    """
+    curve = ENERGY_CURVES[curve_name]
+    return np.interp(bars, curve[:, 0], curve[:, 1])
+
+
+def energy_per_bar(curve_name: str) -> np.ndarray:
+    """Get a curve's energy at every whole bar up to its last breakpoint (read-only float32)."""
+    return _PER_BAR[curve_name]
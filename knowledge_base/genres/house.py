@@ -3,8 +3,20 @@ House Music Genre Knowledge Base
 Based on Beatport categorization and house music characteristics
 """
 
+from ._patterns import pattern_mask
+from ._scales import MAJOR, NATURAL_MINOR, DORIAN, MIXOLYDIAN, MAJOR_PENTATONIC, MINOR_PENTATONIC
+from ._structures import song_structures
+from ._util import freeze_progressions, freeze_strings, share_tuples
+
+__all__ = [
+    "HOUSE_BPMS", "HOUSE_PROGRESSIONS", "HOUSE_CHARACTERISTICS", "HOUSE_DRUM_PATTERNS",
+    "HOUSE_DRUM_MASKS", "HOUSE_SCALES", "HOUSE_CHORD_TYPES", "HOUSE_SONG_STRUCTURES",
+    "HOUSE_INSTRUMENTS", "HOUSE_PRODUCTION_TECHNIQUES",
+    "HOUSE_SONG_STRUCTURES_IDX"
+]
+
 # House music BPM ranges by subgenre
-HOUSE_BPMS = {
+HOUSE_BPMS = share_tuples({
     "deep_house": (118, 125),
     "tech_house": (120, 128), 
     "progressive_house": (120, 130),
@@ -13,10 +25,10 @@ HOUSE_BPMS = {
     "tropical_house": (100, 118),
     "classic_house": (118, 125),
     "acid_house": (115, 130)
-}
+})
 
 # Common chord progressions for house music
-HOUSE_PROGRESSIONS = {
+HOUSE_PROGRESSIONS = freeze_progressions({
     "C": [
         ["C", "Am", "F", "G"],  # vi-IV-I-V classic
         ["C", "F", "Am", "G"],  # I-IV-vi-V pop progression
@@ -42,7 +54,7 @@ HOUSE_PROGRESSIONS = {
         ["G", "Am", "F", "C"],   # I-ii-bVII-IV
         ["G", "D", "Em", "C"]    # I-V-vi-IV
     ]
-}
+})
 
 # House music characteristics by subgenre
 HOUSE_CHARACTERISTICS = {
@@ -118,7 +130,7 @@ HOUSE_CHARACTERISTICS = {
 }
 
 # House drum patterns (16 steps)
-HOUSE_DRUM_PATTERNS = {
+HOUSE_DRUM_PATTERNS = freeze_strings({
     "kick": {
         "four_on_floor": "X...X...X...X...",  # Classic house kick
         "classic": "X...X...X...X...",
@@ -144,31 +156,37 @@ HOUSE_DRUM_PATTERNS = {
         "tambourine": "....X.X.....X.X.",  # Accent pattern
         "cowbell": "......X.......X."   # Sparse cowbell
     }
+})
+
+# Each house pattern packed into a 16-bit step mask (see _patterns)
+HOUSE_DRUM_MASKS = {
+    lane: {name: pattern_mask(steps) for name, steps in patterns.items()}
+    for lane, patterns in HOUSE_DRUM_PATTERNS.items()
 }
 
 # House music scales (semitones from root)
 HOUSE_SCALES = {
-    "major": [0, 2, 4, 5, 7, 9, 11],      # Natural major
-    "minor": [0, 2, 3, 5, 7, 8, 10],      # Natural minor
-    "dorian": [0, 2, 3, 5, 7, 9, 10],     # Popular in house
-    "mixolydian": [0, 2, 4, 5, 7, 9, 10], # Dominant 7th sound
-    "pentatonic_major": [0, 2, 4, 7, 9],   # Safe melodic choice
-    "pentatonic_minor": [0, 3, 5, 7, 10]   # Bluesy feel
+    "major": MAJOR,                        # Natural major
+    "minor": NATURAL_MINOR,                # Natural minor
+    "dorian": DORIAN,                      # Popular in house
+    "mixolydian": MIXOLYDIAN, # Dominant 7th sound
+    "pentatonic_major": MAJOR_PENTATONIC,  # Safe melodic choice
+    "pentatonic_minor": MINOR_PENTATONIC   # Bluesy feel
 }
 
 # House chord types and voicings
-HOUSE_CHORD_TYPES = {
-    "major": [0, 4, 7],           # Basic triad
-    "minor": [0, 3, 7],           # Basic minor
-    "major7": [0, 4, 7, 11],      # Jazz influence
-    "minor7": [0, 3, 7, 10],      # Smooth minor
-    "dominant7": [0, 4, 7, 10],   # Bluesy edge
-    "sus2": [0, 2, 7],            # Open sound
-    "sus4": [0, 5, 7],            # Tension and release
-    "add9": [0, 4, 7, 14],        # Extended harmony
-    "6": [0, 4, 7, 9],            # Vintage house sound
-    "minor6": [0, 3, 7, 9]        # Sophisticated minor
-}
+HOUSE_CHORD_TYPES = share_tuples({
+    "major": (0, 4, 7),           # Basic triad
+    "minor": (0, 3, 7),           # Basic minor
+    "major7": (0, 4, 7, 11),      # Jazz influence
+    "minor7": (0, 3, 7, 10),      # Smooth minor
+    "dominant7": (0, 4, 7, 10),   # Bluesy edge
+    "sus2": (0, 2, 7),            # Open sound
+    "sus4": (0, 5, 7),            # Tension and release
+    "add9": (0, 4, 7, 14),        # Extended harmony
+    "6": (0, 4, 7, 9),            # Vintage house sound
+    "minor6": (0, 3, 7, 9)        # Sophisticated minor
+})
 
 # Common house song structures (in bars)
 HOUSE_SONG_STRUCTURES = {
@@ -200,6 +218,10 @@ HOUSE_SONG_STRUCTURES = {
     }
 }
 
+# The same structures with each section's start bar precomputed, so
+# section_range() is a lookup instead of a walk over the sections
+HOUSE_SONG_STRUCTURES_IDX = song_structures(HOUSE_SONG_STRUCTURES)
+
 # Typical house instruments and sounds
 HOUSE_INSTRUMENTS = {
     "bass": [
@@ -258,4 +280,4 @@ HOUSE_PRODUCTION_TECHNIQUES = {
         "Phaser on hi-hats", 
         "Chorus on chords"
     ]
-}
\ No newline at end of file
+}
@@ -0,0 +1,136 @@
+"""
+Vectorized Intervals
+
+The scale and chord interval tables of the house, techno and trance
+modules as read-only int8 NumPy arrays, built once so vectorized melody
+and chord generators can add a root or an octave offset without copying
+the tuples on every call. quantize_to_scale() snaps MIDI notes to a
+scale; it is JIT-compiled when Numba is installed. progression_codes()
+gives a genre's progressions in a key as one (progression, chord) array
+of _chord_codec codes, which transpose_codes() shifts all at once.
+Requires NumPy.
+"""
+
+from functools import lru_cache
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; quantize_to_scale() then uses NumPy broadcasting
+    njit = None
+
+from . import encoded_progressions_for
+from ._chord_codec import _ROOT_MASK
+from .house import HOUSE_CHORD_TYPES, HOUSE_SCALES
+from .techno import CHORD_TYPES, SCALES
+from .trance import TRANCE_CHORD_TYPES, TRANCE_SCALES
+
+# One array per distinct interval tuple; the genre tables share their tuples
+_ARRAYS: Dict[Tuple[int, ...], np.ndarray] = {}
+
+
+def interval_arrays(table: Mapping[str, Tuple[int, ...]]) -> Dict[str, np.ndarray]:
+    """
+    Convert a table of interval tuples to read-only int8 arrays.
+
+    Args:
+        table: Name -> semitone offsets (e.g. HOUSE_SCALES)
+
+    Returns:
+        Name -> int8 array, shared between tables listing the same intervals
+    """
+    arrays = {}
+    for name, intervals in table.items():
+        array = _ARRAYS.get(intervals)
+        if array is None:
+            array = np.asarray(intervals, dtype=np.int8)
+            array.flags.writeable = False
+            _ARRAYS[intervals] = array
+        arrays[name] = array
+    return arrays
+
+
+HOUSE_SCALES_NP = interval_arrays(HOUSE_SCALES)
+HOUSE_CHORD_TYPES_NP = interval_arrays(HOUSE_CHORD_TYPES)
+SCALES_NP = interval_arrays(SCALES)
+CHORD_TYPES_NP = interval_arrays(CHORD_TYPES)
+TRANCE_SCALES_NP = interval_arrays(TRANCE_SCALES)
+TRANCE_CHORD_TYPES_NP = interval_arrays(TRANCE_CHORD_TYPES)
+
+
+def _quantize_loop(notes: np.ndarray, scale: np.ndarray, root: float) -> np.ndarray:
+    """Find the nearest scale note per note among its own and the two neighbouring octaves."""
+    quantized = np.empty_like(notes)
+    for i in range(notes.shape[0]):
+        note = notes[i]
+        octave = np.floor((note - root) / 12.0) * 12.0 + root
+        best = octave + scale[0] - 12.0
+        best_distance = abs(note - best)
+        for shift in range(-1, 2):
+            for degree in range(scale.shape[0]):
+                candidate = octave + shift * 12.0 + scale[degree]
+                distance = abs(note - candidate)
+                if distance < best_distance:
+                    best = candidate
+                    best_distance = distance
+        quantized[i] = best
+    return quantized
+
+
+def _quantize_broadcast(notes: np.ndarray, scale: np.ndarray, root: float) -> np.ndarray:
+    """The same search as _quantize_loop, as one (notes x candidates) array operation."""
+    octaves = np.floor((notes - root) / 12.0) * 12.0 + root
+    offsets = np.concatenate((scale - 12.0, scale.astype(np.float64), scale + 12.0))
+    candidates = octaves[:, None] + offsets
+    nearest = np.abs(notes[:, None] - candidates).argmin(axis=1)
+    return candidates[np.arange(notes.shape[0]), nearest]
+
+
+_quantize = _quantize_broadcast if njit is None else njit(cache=True, fastmath=True)(_quantize_loop)
+
+
+def quantize_to_scale(notes, scale, root: float = 0) -> np.ndarray:
+    """
+    Snap MIDI notes to the nearest note of a scale (ties go to the lower note).
+
+    Args:
+        notes: MIDI note numbers, fractional values allowed
+        scale: Ascending semitone offsets from the root (e.g. HOUSE_SCALES_NP["dorian"])
+        root: MIDI note or pitch class of the scale's root (e.g. 9 for A)
+
+    Returns:
+        The quantized notes as a float64 array
+    """
+    notes = np.ascontiguousarray(notes, dtype=np.float64).ravel()
+    scale = np.ascontiguousarray(scale, dtype=np.int8)
+    return _quantize(notes, scale, float(root))
+
+
+# Every progression in the genre tables has four chords
+_NO_PROGRESSIONS = np.empty((0, 4), dtype=np.uint8)
+_NO_PROGRESSIONS.flags.writeable = False
+
+
+@lru_cache(maxsize=256)
+def progression_codes(genre: str, key: str) -> np.ndarray:
+    """
+    Get encoded_progressions_for(genre, key) as one array.
+
+    Returns:
+        A read-only (progression, chord) uint8 array of chord codes
+        (no rows if the genre has no progressions in the key)
+    """
+    codes = encoded_progressions_for(genre, key)
+    if not codes:
+        return _NO_PROGRESSIONS
+    array = np.array(codes, dtype=np.uint8)
+    array.flags.writeable = False
+    return array
+
+
+def transpose_codes(codes: np.ndarray, semitones: int) -> np.ndarray:
+    """Shift the root of every chord code in an array by ``semitones`` (qualities are kept)."""
+    roots = (codes & _ROOT_MASK).astype(np.int16)
+    return ((roots + semitones) % 12).astype(np.uint8) | (codes & ~np.uint8(_ROOT_MASK))
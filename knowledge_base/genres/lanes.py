@@ -0,0 +1,94 @@
+"""
+Vectorized Drum Lanes
+
+The kick and snare hits of every DNB_DRUM_PATTERNS entry packed into
+parallel uint16 step-mask arrays (one row per pattern), so lanes can be
+compared across all patterns in single NumPy operations. Step pattern
+strings are also available as (pattern, step) boolean matrices.
+Requires NumPy.
+"""
+
+from typing import Iterable, Tuple
+
+import numpy as np
+
+from ._patterns import STEPS, hits_mask, mask_hits
+from .breakbeat import BREAKBEAT_PATTERNS
+from .drum_and_bass import DNB_DRUM_PATTERNS, DNB_TEMPO_TECHNIQUES
+
+PATTERN_NAMES: Tuple[str, ...] = tuple(DNB_DRUM_PATTERNS)
+_ROWS = {name: i for i, name in enumerate(PATTERN_NAMES)}
+
+
+def _lane_masks(lane: str) -> np.ndarray:
+    """Pack one lane of every pattern into a read-only uint16 array."""
+    masks = np.array(
+        [hits_mask(DNB_DRUM_PATTERNS[name][lane]) for name in PATTERN_NAMES],
+        dtype=np.uint16
+    )
+    masks.flags.writeable = False
+    return masks
+
+
+KICK_MASKS = _lane_masks("kick_hits")
+SNARE_MASKS = _lane_masks("snare_hits")
+
+
+def coincident_masks() -> np.ndarray:
+    """Get, per pattern, the steps where kick and snare both hit."""
+    return KICK_MASKS & SNARE_MASKS
+
+
+def combined_masks() -> np.ndarray:
+    """Get, per pattern, the steps where the kick or the snare hits."""
+    return KICK_MASKS | SNARE_MASKS
+
+
+def coincident_hits(pattern_name: str) -> Tuple[int, ...]:
+    """Get the steps of a pattern where kick and snare both hit."""
+    i = _ROWS[pattern_name]
+    return mask_hits(int(KICK_MASKS[i] & SNARE_MASKS[i]))
+
+
+def step_matrix(patterns: Iterable[str]) -> np.ndarray:
+    """
+    Stack 16-step pattern strings into one boolean hit matrix.
+    
+    All patterns are joined into a single ASCII buffer and compared
+    against "X" in one vectorized pass.
+    
+    Args:
+        patterns: Step pattern strings (e.g. "X..X.X.XX.X.X..X")
+        
+    Returns:
+        A read-only (len(patterns), 16) bool array, True where a step hits
+    """
+    steps = np.frombuffer("".join(patterns).encode("ascii"), dtype=np.uint8)
+    matrix = steps.reshape(-1, STEPS) == ord("X")
+    matrix.flags.writeable = False
+    return matrix
+
+
+# One row per pattern, in BREAKBEAT_PATTERNS / PATTERN_NAMES order
+BREAKBEAT_STEPS = step_matrix(BREAKBEAT_PATTERNS.values())
+DNB_STEPS = step_matrix(DNB_DRUM_PATTERNS[name]["pattern"] for name in PATTERN_NAMES)
+
+
+def _tempo_steps():
+    """Decode every *_pattern lane of each DNB_TEMPO_TECHNIQUES entry (all in one pass)."""
+    lanes = [
+        (technique, key[:-len("_pattern")], steps)
+        for technique, info in DNB_TEMPO_TECHNIQUES.items()
+        for key, steps in info.items()
+        if key.endswith("_pattern")
+    ]
+    matrix = step_matrix(steps for _, _, steps in lanes)
+    tempo_steps = {}
+    for (technique, lane, _), row in zip(lanes, matrix):
+        tempo_steps.setdefault(technique, {})[lane] = row
+    return tempo_steps
+
+
+# Technique -> lane ("kick", "snare") -> read-only bool step array,
+# e.g. TEMPO_STEPS["half_time"]["kick"] | TEMPO_STEPS["double_time"]["snare"]
+TEMPO_STEPS = _tempo_steps()
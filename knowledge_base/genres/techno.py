@@ -2,8 +2,19 @@
 Techno Genre Knowledge Base
 """
 
+from ._patterns import pattern_mask
+from ._scales import NATURAL_MINOR, HARMONIC_MINOR, DORIAN, PHRYGIAN
+from ._structures import song_structures
+from ._util import freeze_progressions, freeze_strings, share_tuples
+
+__all__ = [
+    "TECHNO_BPMS", "TECHNO_PROGRESSIONS", "INDUSTRIAL_ELEMENTS", "SONG_STRUCTURES",
+    "DRUM_PATTERNS", "DRUM_MASKS", "SCALES", "CHORD_TYPES",
+    "SONG_STRUCTURES_IDX"
+]
+
 # Typical BPM ranges for different techno substyles
-TECHNO_BPMS = {
+TECHNO_BPMS = share_tuples({
     "minimal": (125, 132),
     "detroit": (130, 140), 
     "berlin": (128, 136),
@@ -11,10 +22,10 @@ TECHNO_BPMS = {
     "peak_time": (130, 138),
     "underground": (128, 135),
     "hard_techno": (140, 150)
-}
+})
 
 # Common chord progressions for techno music
-TECHNO_PROGRESSIONS = {
+TECHNO_PROGRESSIONS = freeze_progressions({
     "Am": [
         ["Am", "F", "C", "G"],
         ["Am", "Dm", "G", "C"], 
@@ -43,7 +54,7 @@ TECHNO_PROGRESSIONS = {
         ["Gm", "Eb", "F", "Gm"],
         ["Gm", "Dm", "Eb", "F"]
     ]
-}
+})
 
 # Industrial techno characteristics
 INDUSTRIAL_ELEMENTS = {
@@ -97,8 +108,12 @@ SONG_STRUCTURES = {
     }
 }
 
+# The same structures with each section's start bar precomputed, so
+# section_range() is a lookup instead of a walk over the sections
+SONG_STRUCTURES_IDX = song_structures(SONG_STRUCTURES)
+
 # Drum patterns (16 steps, X = hit, . = rest)
-DRUM_PATTERNS = {
+DRUM_PATTERNS = freeze_strings({
     "kick": {
         "four_on_floor": "X...X...X...X...",
         "syncopated": "X...X..XX..X....",
@@ -117,24 +132,30 @@ DRUM_PATTERNS = {
         "minimal": "..X.....X.......",
         "complex": "X.XX..X.X.X..XX."
     }
+})
+
+# Each pattern packed into a 16-bit step mask (see _patterns)
+DRUM_MASKS = {
+    lane: {name: pattern_mask(steps) for name, steps in patterns.items()}
+    for lane, patterns in DRUM_PATTERNS.items()
 }
 
 # Scale and chord information
 SCALES = {
-    "natural_minor": [0, 2, 3, 5, 7, 8, 10],  # W-H-W-W-H-W-W
-    "harmonic_minor": [0, 2, 3, 5, 7, 8, 11], 
-    "dorian": [0, 2, 3, 5, 7, 9, 10],
-    "phrygian": [0, 1, 3, 5, 7, 8, 10]
+    "natural_minor": NATURAL_MINOR,  # W-H-W-W-H-W-W
+    "harmonic_minor": HARMONIC_MINOR, 
+    "dorian": DORIAN,
+    "phrygian": PHRYGIAN
 }
 
 # Common techno chord types
-CHORD_TYPES = {
-    "minor": [0, 3, 7],
-    "major": [0, 4, 7], 
-    "minor7": [0, 3, 7, 10],
-    "major7": [0, 4, 7, 11],
-    "sus2": [0, 2, 7],
-    "sus4": [0, 5, 7],
-    "add9": [0, 4, 7, 14],  # 14 = 2 + 12 (octave)
-    "power": [0, 7]  # Root and fifth only
-}
\ No newline at end of file
+CHORD_TYPES = share_tuples({
+    "minor": (0, 3, 7),
+    "major": (0, 4, 7), 
+    "minor7": (0, 3, 7, 10),
+    "major7": (0, 4, 7, 11),
+    "sus2": (0, 2, 7),
+    "sus4": (0, 5, 7),
+    "add9": (0, 4, 7, 14),  # 14 = 2 + 12 (octave)
+    "power": (0, 7)  # Root and fifth only
+})
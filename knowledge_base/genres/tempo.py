@@ -0,0 +1,70 @@
+"""
+Vectorized Tempo Ranges
+
+Every subgenre BPM range of the genre modules (TECHNO_BPMS, HOUSE_BPMS, ...)
+packed into one NumPy structured array, so finding the subgenres that
+contain a tempo, or a whole run of tempos, is a single comparison over
+all rows. The *_BPMS dicts stay the reference tables; for whole genres
+and integer tempos, genres_for_bpm() in the package is an O(1) lookup.
+Importing this module loads every genre module and requires NumPy.
+"""
+
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from . import _GENRE_MODULES, _lazy
+
+BPM_DTYPE = np.dtype([
+    ("genre", "U16"),
+    ("name", "U24"),
+    ("lo", "i2"),
+    ("hi", "i2")
+])
+
+
+def _build_bpm_table() -> np.ndarray:
+    """Collect every subgenre range, grouped by genre in _GENRE_MODULES order."""
+    rows = []
+    for genre, attrs in _GENRE_MODULES.items():
+        # Each module's BPM table is listed first
+        for name, (low, high) in _lazy(attrs[0]).items():
+            rows.append((genre, name, low, high))
+    table = np.array(rows, dtype=BPM_DTYPE)
+    table.flags.writeable = False
+    return table
+
+
+BPM_TABLE = _build_bpm_table()
+
+
+def subgenres_for_bpm(bpm: float, genre: Optional[str] = None) -> List[str]:
+    """
+    Get the subgenres whose BPM range contains a tempo.
+
+    Args:
+        bpm: Tempo in beats per minute
+        genre: Only search this genre module's table (e.g. "house")
+
+    Returns:
+        Matching subgenre names, in BPM_TABLE order
+    """
+    matches = (BPM_TABLE["lo"] <= bpm) & (bpm <= BPM_TABLE["hi"])
+    if genre is not None:
+        matches &= BPM_TABLE["genre"] == genre
+    return BPM_TABLE["name"][matches].tolist()
+
+
+def bpm_matrix(bpms: Iterable[float]) -> np.ndarray:
+    """
+    Test many tempos against every subgenre range at once.
+
+    Args:
+        bpms: Tempos in beats per minute
+
+    Returns:
+        A (len(bpms), len(BPM_TABLE)) bool array, True where a row's range
+        contains the tempo
+    """
+    bpms = np.fromiter(bpms, dtype=np.float32)
+    return (BPM_TABLE["lo"] <= bpms[:, None]) & (bpms[:, None] <= BPM_TABLE["hi"])
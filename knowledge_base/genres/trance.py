@@ -3,8 +3,23 @@ Trance Music Genre Knowledge Base
 Based on Beatport categorization and trance music characteristics
 """
 
+from ._patterns import pattern_mask
+from ._scales import (
+    NATURAL_MINOR, HARMONIC_MINOR, HUNGARIAN_MINOR, DORIAN, PHRYGIAN, MIXOLYDIAN, MINOR_PENTATONIC
+)
+from ._structures import song_structures
+from ._util import freeze_progressions, freeze_strings, share_tuples
+
+__all__ = [
+    "TRANCE_BPMS", "TRANCE_PROGRESSIONS", "TRANCE_CHARACTERISTICS", "TRANCE_DRUM_PATTERNS",
+    "TRANCE_DRUM_MASKS", "TRANCE_REVERSED_MASKS",
+    "TRANCE_SCALES", "TRANCE_CHORD_TYPES", "TRANCE_SONG_STRUCTURES", "TRANCE_INSTRUMENTS",
+    "TRANCE_PRODUCTION_TECHNIQUES", "TRANCE_ENERGY_CURVES",
+    "TRANCE_SONG_STRUCTURES_IDX"
+]
+
 # Trance music BPM ranges by subgenre
-TRANCE_BPMS = {
+TRANCE_BPMS = share_tuples({
     "progressive_trance": (128, 136),
     "uplifting_trance": (132, 140),
     "tech_trance": (130, 138),
@@ -13,10 +28,10 @@ TRANCE_BPMS = {
     "hard_trance": (140, 150),
     "ambient_trance": (120, 132),
     "classic_trance": (130, 140)
-}
+})
 
 # Common chord progressions for trance music
-TRANCE_PROGRESSIONS = {
+TRANCE_PROGRESSIONS = freeze_progressions({
     "Am": [
         ["Am", "F", "C", "G"],      # Emotional minor progression
         ["Am", "G", "F", "E"],      # Dramatic descending
@@ -43,7 +58,7 @@ TRANCE_PROGRESSIONS = {
         ["Bm", "Em", "A", "D"],     # Circle progression
         ["Bm", "D", "G", "A"]       # Major relative lift
     ]
-}
+})
 
 # Trance music characteristics by subgenre
 TRANCE_CHARACTERISTICS = {
@@ -119,13 +134,13 @@ TRANCE_CHARACTERISTICS = {
 }
 
 # Trance drum patterns (16 steps)
-TRANCE_DRUM_PATTERNS = {
+TRANCE_DRUM_PATTERNS = freeze_strings({
     "kick": {
         "four_on_floor": "X...X...X...X...",  # Standard trance kick
         "progressive": "X.......X.......",    # More spacious
         "uplifting": "X...X...X...X...",     # Consistent energy
         "psy": "X..X.X..X..X.X..",           # Syncopated psytrance
-        "hard": "X...X.X.X...X.."            # Hard trance pattern
+        "hard": "X...X.X.X...X..."           # Hard trance pattern
     },
     "snare": {
         "standard": "....X.......X...",      # Classic 2 & 4
@@ -148,35 +163,48 @@ TRANCE_DRUM_PATTERNS = {
         "tribal": "X..X.X..X..X.X..",       # Tribal percussion
         "bells": "......X.......X."         # Sparse bells
     }
+})
+
+# Each trance pattern packed into a 16-bit step mask (see _patterns)
+TRANCE_DRUM_MASKS = {
+    lane: {name: pattern_mask(steps) for name, steps in patterns.items()}
+    for lane, patterns in TRANCE_DRUM_PATTERNS.items()
+}
+
+# The reversed-snare ("R") steps, for the patterns that have any
+TRANCE_REVERSED_MASKS = {
+    lane: {name: pattern_mask(steps, hit="R") for name, steps in patterns.items() if "R" in steps}
+    for lane, patterns in TRANCE_DRUM_PATTERNS.items()
+    if any("R" in steps for steps in patterns.values())
 }
 
 # Trance-specific scales and modes
 TRANCE_SCALES = {
-    "natural_minor": [0, 2, 3, 5, 7, 8, 10],    # Most common in trance
-    "harmonic_minor": [0, 2, 3, 5, 7, 8, 11],   # Dramatic sound
-    "dorian": [0, 2, 3, 5, 7, 9, 10],           # Progressive trance
-    "aeolian": [0, 2, 3, 5, 7, 8, 10],          # Natural minor mode
-    "phrygian": [0, 1, 3, 5, 7, 8, 10],         # Dark, exotic sound
-    "mixolydian": [0, 2, 4, 5, 7, 9, 10],       # Dominant 7th sound
-    "pentatonic_minor": [0, 3, 5, 7, 10],        # Emotional melodies
-    "hungarian_minor": [0, 2, 3, 6, 7, 8, 11]   # Exotic, dramatic
+    "natural_minor": NATURAL_MINOR,        # Most common in trance
+    "harmonic_minor": HARMONIC_MINOR,      # Dramatic sound
+    "dorian": DORIAN,                      # Progressive trance
+    "aeolian": NATURAL_MINOR,              # Natural minor mode
+    "phrygian": PHRYGIAN,                  # Dark, exotic sound
+    "mixolydian": MIXOLYDIAN,              # Dominant 7th sound
+    "pentatonic_minor": MINOR_PENTATONIC,  # Emotional melodies
+    "hungarian_minor": HUNGARIAN_MINOR     # Exotic, dramatic
 }
 
 # Trance chord types and extensions
-TRANCE_CHORD_TYPES = {
-    "minor": [0, 3, 7],           # Basic minor triad
-    "major": [0, 4, 7],           # Basic major triad
-    "minor7": [0, 3, 7, 10],      # Minor seventh
-    "major7": [0, 4, 7, 11],      # Major seventh
-    "sus2": [0, 2, 7],            # Suspended second
-    "sus4": [0, 5, 7],            # Suspended fourth
-    "add9": [0, 4, 7, 14],        # Added ninth
-    "minor_add9": [0, 3, 7, 14],  # Minor with added ninth
-    "dominant7": [0, 4, 7, 10],   # Dominant seventh
-    "diminished": [0, 3, 6],      # Diminished triad
-    "augmented": [0, 4, 8],       # Augmented triad
-    "minor_major7": [0, 3, 7, 11] # Minor with major seventh
-}
+TRANCE_CHORD_TYPES = share_tuples({
+    "minor": (0, 3, 7),           # Basic minor triad
+    "major": (0, 4, 7),           # Basic major triad
+    "minor7": (0, 3, 7, 10),      # Minor seventh
+    "major7": (0, 4, 7, 11),      # Major seventh
+    "sus2": (0, 2, 7),            # Suspended second
+    "sus4": (0, 5, 7),            # Suspended fourth
+    "add9": (0, 4, 7, 14),        # Added ninth
+    "minor_add9": (0, 3, 7, 14),  # Minor with added ninth
+    "dominant7": (0, 4, 7, 10),   # Dominant seventh
+    "diminished": (0, 3, 6),      # Diminished triad
+    "augmented": (0, 4, 8),       # Augmented triad
+    "minor_major7": (0, 3, 7, 11) # Minor with major seventh
+})
 
 # Trance song structures (in bars)
 TRANCE_SONG_STRUCTURES = {
@@ -218,6 +246,10 @@ TRANCE_SONG_STRUCTURES = {
     }
 }
 
+# The same structures with each section's start bar precomputed, so
+# section_range() is a lookup instead of a walk over the sections
+TRANCE_SONG_STRUCTURES_IDX = song_structures(TRANCE_SONG_STRUCTURES)
+
 # Typical trance instruments and sounds
 TRANCE_INSTRUMENTS = {
     "bass": [
@@ -313,4 +345,4 @@ TRANCE_ENERGY_CURVES = {
         (96, 95),   # Main drop
         (128, 25)   # Outro
     ]
-}
\ No newline at end of file
+}
@@ -5,27 +5,79 @@ This module contains comprehensive information about Ableton Live Suite instrume
 including categorization, presets, parameters, and genre recommendations.
 """
 
-from .synthesizers import SYNTHESIZERS
-from .samplers import SAMPLERS
-from .drums import DRUMS
-from .bass import BASS_INSTRUMENTS
-from .pads import PADS
-from .leads import LEADS
-from .keys import KEYS
-
-# Master instruments database
-INSTRUMENTS_DB = {
-    "synthesizers": SYNTHESIZERS,
-    "samplers": SAMPLERS,
-    "drums": DRUMS,
-    "bass": BASS_INSTRUMENTS,
-    "pads": PADS,
-    "leads": LEADS,
-    "keys": KEYS
+from collections.abc import Mapping
+from functools import lru_cache
+from importlib import import_module
+from types import MappingProxyType
+
+from ..effects._frozen import freeze, normalize_query
+from .spec import Instrument
+
+# Category -> (submodule, attribute) holding its instruments. Submodules are
+# only imported when a category (or its attribute, e.g. PADS) is used.
+_CATEGORY_MODULES = {
+    "synthesizers": ("synthesizers", "SYNTHESIZERS"),
+    "samplers": ("samplers", "SAMPLERS"),
+    "drums": ("drums", "DRUMS"),
+    "bass": ("bass", "BASS_INSTRUMENTS"),
+    "pads": ("pads", "PADS"),
+    "leads": ("leads", "LEADS"),
+    "keys": ("keys", "KEYS")
 }
 
-# Genre-specific instrument recommendations
-GENRE_INSTRUMENTS = {
+_LAZY_ATTRIBUTES = {attr: module for module, attr in _CATEGORY_MODULES.values()}
+
+__all__ = [
+    *_LAZY_ATTRIBUTES,
+    "GENRE_INSTRUMENTS",
+    "INSTRUMENTS_DB",
+    "get_instruments_by_category",
+    "get_instruments_by_genre",
+    "normalize_query",
+    "search_instruments"
+]
+
+
+def __getattr__(name: str):
+    """Import a category's submodule on first access."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{_LAZY_ATTRIBUTES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def _lazy(name: str):
+    """Look up a lazily loaded module attribute from inside this module."""
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+class _InstrumentsDatabase(Mapping):
+    """Read-only category -> instruments mapping that loads categories on demand."""
+    
+    def __getitem__(self, category: str):
+        _, attr = _CATEGORY_MODULES[category]
+        return _lazy(attr)
+    
+    def __iter__(self):
+        return iter(_CATEGORY_MODULES)
+    
+    def __len__(self):
+        return len(_CATEGORY_MODULES)
+
+
+# Master instruments database (read-only, like each category table)
+INSTRUMENTS_DB = _InstrumentsDatabase()
+
+# Genre-specific instrument recommendations (read-only, keys lowercase and interned)
+GENRE_INSTRUMENTS = freeze({
     "techno": {
         "drums": ["Drum_Kit", "Analog_Kick", "Techno_Hats"],
         "bass": ["Analog_Bass", "FM_Bass", "Wobble_Bass"],
@@ -44,27 +96,73 @@ GENRE_INSTRUMENTS = {
         "leads": ["Trance_Lead", "Supersaw_Lead", "Arpeggiated_Lead"],
         "pads": ["Epic_Pad", "Sweeping_Pad"]
     }
-}
+})
+
+_EMPTY = MappingProxyType({})
+
+_TRIGRAM = 3
+
+def _trigrams(text: str):
+    return {text[i:i + _TRIGRAM] for i in range(len(text) - _TRIGRAM + 1)}
+
+@lru_cache(maxsize=None)
+def _search_tables():
+    """
+    Build the search tables on first use (this loads every category).
+    
+    Returns:
+        ((category, name, lowercased name, info, lowercased description)
+        for every instrument in catalog order; each trigram of the
+        lowercased names and descriptions mapped to the positions of the
+        entries containing it)
+    """
+    entries = tuple(
+        (category, name, name.lower(), info, info.get("description", "").lower())
+        for category, instruments in INSTRUMENTS_DB.items()
+        for name, info in instruments.items()
+    )
+    index = {}
+    for position, (_, _, name_lc, _, description_lc) in enumerate(entries):
+        for trigram in _trigrams(name_lc) | _trigrams(description_lc):
+            index.setdefault(trigram, []).append(position)
+    return entries, {trigram: frozenset(positions) for trigram, positions in index.items()}
 
 def get_instruments_by_category(category: str = None):
     """Get instruments filtered by category."""
     if category:
-        return INSTRUMENTS_DB.get(category, {})
+        return INSTRUMENTS_DB.get(category, _EMPTY)
     return INSTRUMENTS_DB
 
 def get_instruments_by_genre(genre: str):
-    """Get recommended instruments for a specific genre."""
-    return GENRE_INSTRUMENTS.get(genre.lower(), {})
+    """Get recommended instruments for a specific genre (a plain role -> names copy)."""
+    # Keys are all lowercase, so lowercase queries (e.g. from normalize_query)
+    # skip the str.lower() copy
+    table = GENRE_INSTRUMENTS.get(genre if genre.islower() else genre.lower(), _EMPTY)
+    return {role: list(names) for role, names in table.items()}
 
 def search_instruments(search_term: str):
-    """Search instruments by name or description."""
+    """Search instruments by name or description (results are plain dicts, e.g. for json.dumps)."""
+    entries = _search_tables()[0]
     results = {}
-    for category, instruments in INSTRUMENTS_DB.items():
-        category_results = {}
-        for name, info in instruments.items():
-            if (search_term.lower() in name.lower() or 
-                search_term.lower() in info.get("description", "").lower()):
-                category_results[name] = info
-        if category_results:
-            results[category] = category_results
-    return results
\ No newline at end of file
+    for position in _search_instruments(search_term if search_term.islower() else search_term.lower()):
+        category, name, _, info, _ = entries[position]
+        results.setdefault(category, {})[name] = info.to_dict() if isinstance(info, Instrument) else info
+    return results
+
+@lru_cache(maxsize=256)
+def _search_instruments(term: str):
+    """Cached search for a lowercased term: the matching _search_tables() entry positions."""
+    entries, index = _search_tables()
+    if len(term) < _TRIGRAM:
+        candidates = range(len(entries))
+    else:
+        # Entries containing the term contain all its trigrams; the
+        # substring check below drops the ones that only share trigrams
+        candidates = sorted(frozenset.intersection(*(
+            index.get(trigram, frozenset()) for trigram in _trigrams(term)
+        )))
+    
+    return tuple(
+        position for position in candidates
+        if term in entries[position][2] or term in entries[position][4]
+    )
@@ -4,7 +4,13 @@ Bass Instruments Knowledge Base
 Comprehensive database of bass instruments and sounds for electronic music production.
 """
 
-BASS_INSTRUMENTS = {
+from bisect import bisect_left
+from functools import lru_cache
+from types import MappingProxyType
+
+from .spec import build_instruments
+
+BASS_INSTRUMENTS = build_instruments({
     "Analog_Bass": {
         "description": "Classic analog bass synthesizer",
         "category": "bass",
@@ -82,7 +88,7 @@ BASS_INSTRUMENTS = {
         "frequency_range": (60, 300),
         "device_path": "Live/Bass/FM Bass"
     }
-}
+})
 
 # Bass patterns and playing styles by genre
 BASS_PATTERNS = {
@@ -116,17 +122,40 @@ BASS_PATTERNS = {
     }
 }
 
+# (low, high, catalog position, name) per bass instrument, sorted by low frequency
+_BY_LOW_FREQUENCY = sorted(
+    (*info.frequency_range, position, name)
+    for position, (name, info) in enumerate(BASS_INSTRUMENTS.items())
+)
+_LOW_FREQUENCIES = [entry[0] for entry in _BY_LOW_FREQUENCY]
+
+@lru_cache(maxsize=256)
 def get_bass_by_frequency_range(min_freq: int, max_freq: int):
     """Get bass instruments within specified frequency range."""
-    return {name: info for name, info in BASS_INSTRUMENTS.items()
-            if (info["frequency_range"][0] >= min_freq and 
-                info["frequency_range"][1] <= max_freq)}
+    hits = []
+    # Entries below min_freq are skipped by bisection; the scan stops once
+    # an entry starts above max_freq, since none after it can fit
+    for low, high, position, name in _BY_LOW_FREQUENCY[bisect_left(_LOW_FREQUENCIES, min_freq):]:
+        if low > max_freq:
+            break
+        if high <= max_freq:
+            hits.append((position, name))
+    return MappingProxyType({name: BASS_INSTRUMENTS[name] for _, name in sorted(hits)})
+
+_EMPTY = MappingProxyType({})
+
+# genre -> bass instruments tagged with it, bucketed once at import
+_BASS_BY_GENRE = {}
+for _name, _info in BASS_INSTRUMENTS.items():
+    for _genre in _info.genres:
+        _BASS_BY_GENRE.setdefault(_genre.lower(), {})[_name] = _info
+_BASS_BY_GENRE = {genre: MappingProxyType(bass) for genre, bass in _BASS_BY_GENRE.items()}
+del _name, _info, _genre
 
 def get_bass_by_genre(genre: str):
     """Get bass recommendations for a specific genre."""
-    return {name: info for name, info in BASS_INSTRUMENTS.items()
-            if genre.lower() in info["genres"]}
+    return _BASS_BY_GENRE.get(genre if genre.islower() else genre.lower(), _EMPTY)
 
 def get_bass_pattern_info(genre: str):
     """Get bass pattern and playing style info for a genre."""
-    return BASS_PATTERNS.get(genre.lower(), {})
\ No newline at end of file
+    return BASS_PATTERNS.get(genre if genre.islower() else genre.lower(), _EMPTY)
@@ -4,7 +4,9 @@ Drum Instruments Knowledge Base
 Comprehensive database of Ableton Live Suite drum instruments and kits.
 """
 
-DRUMS = {
+from types import MappingProxyType
+
+DRUMS = MappingProxyType({
     "Drum_Racks": {
         "description": "Container for drum samples with built-in effects",
         "category": "drums",
@@ -80,7 +82,7 @@ DRUMS = {
         },
         "device_path": "Live/Analog Hi-Hat"
     }
-}
+})
 
 # Drum patterns by genre (BPM and rhythm characteristics)
 DRUM_PATTERNS = {
@@ -4,7 +4,9 @@ Keys Instruments Knowledge Base
 Comprehensive database of keyboard instruments for harmonic and melodic elements.
 """
 
-KEYS = {
+from types import MappingProxyType
+
+KEYS = MappingProxyType({
     "Electric_Piano": {
         "description": "Electric piano emulation with vintage character",
         "category": "keys",
@@ -85,7 +87,7 @@ KEYS = {
         "frequency_range": (100, 3000),
         "device_path": "Live/Keys/Clavinet"
     }
-}
+})
 
 # Keys usage patterns by genre
 KEYS_USAGE = {
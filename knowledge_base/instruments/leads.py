@@ -4,7 +4,9 @@ Lead Instruments Knowledge Base
 Comprehensive database of lead instruments for melody and hook elements.
 """
 
-LEADS = {
+from types import MappingProxyType
+
+LEADS = MappingProxyType({
     "Acid_Lead": {
         "description": "Classic acid lead with filter modulation",
         "category": "leads",
@@ -88,7 +90,7 @@ LEADS = {
         "frequency_range": (500, 5000),
         "device_path": "Live/Leads/Arp Lead"
     }
-}
+})
 
 # Lead usage patterns by genre
 LEAD_USAGE = {
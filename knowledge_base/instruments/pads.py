@@ -4,7 +4,9 @@ Pad Instruments Knowledge Base
 Comprehensive database of pad instruments for atmospheric and background elements.
 """
 
-PADS = {
+from types import MappingProxyType
+
+PADS = MappingProxyType({
     "Analog_Pad": {
         "description": "Warm analog-style pad synthesizer",
         "category": "pads",
@@ -86,7 +88,7 @@ PADS = {
         "frequency_range": (200, 2500),
         "device_path": "Live/Pads/Choir Pad"
     }
-}
+})
 
 # Pad usage patterns by genre
 PAD_USAGE = {
@@ -4,7 +4,9 @@ Samplers Knowledge Base
 Comprehensive database of sampler instruments and sampling techniques.
 """
 
-SAMPLERS = {
+from types import MappingProxyType
+
+SAMPLERS = MappingProxyType({
     "Simpler": {
         "description": "Basic sampler for single samples",
         "category": "sampler",
@@ -87,7 +89,7 @@ SAMPLERS = {
         "sample_formats": ["rex", "rx2"],
         "device_path": "Live/Rex Player"
     }
-}
+})
 
 # Sampling techniques by genre
 SAMPLING_TECHNIQUES = {
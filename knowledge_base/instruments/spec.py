@@ -0,0 +1,104 @@
+"""
+Instrument record for the instrument category tables.
+"""
+
+from collections.abc import Mapping as MappingABC
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+
+from .._records import DictAccess
+
+
+class ParamTable(MappingABC):
+    """
+    Read-only parameter name -> {"min", "max", "default"} mapping packed into bytes.
+    
+    Instrument parameters are MIDI-style integers, so each one is stored as
+    three bytes (min, max, default) in a single buffer, in table order.
+    """
+    
+    __slots__ = ("names", "data", "_rows")
+    
+    def __init__(self, key_parameters: Mapping[str, Mapping[str, int]]):
+        """
+        Args:
+            key_parameters: Parameter name -> {"min", "max", "default"}
+            
+        Raises:
+            ValueError: A value is not an integer in 0-255
+        """
+        self.names = tuple(key_parameters)
+        try:
+            self.data = bytes(
+                value for info in key_parameters.values()
+                for value in (info["min"], info["max"], info["default"])
+            )
+        except (TypeError, ValueError):
+            raise ValueError(
+                f"Parameter values must be integers in 0-255: {dict(key_parameters)}"
+            ) from None
+        self._rows = {name: i * 3 for i, name in enumerate(self.names)}
+    
+    def __getitem__(self, name: str) -> Mapping[str, int]:
+        row = self._rows[name]
+        low, high, default = self.data[row:row + 3]
+        return MappingProxyType({"min": low, "max": high, "default": default})
+    
+    def __iter__(self):
+        return iter(self.names)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    @property
+    def defaults(self) -> bytes:
+        """Every parameter's default value, one byte each in table order."""
+        return self.data[2::3]
+
+
+@dataclass(slots=True, frozen=True)
+class Instrument(DictAccess):
+    """Read-only description of one instrument or sound."""
+
+    description: str
+    category: str
+    genres: Tuple[str, ...]
+    presets: Mapping[str, Tuple[str, ...]]
+    key_parameters: ParamTable
+    frequency_range: Tuple[int, int]
+    device_path: str
+
+    def to_dict(self) -> dict:
+        """Get the record as a plain (mutable) nested dict, for callers that need one."""
+        return {
+            "description": self.description,
+            "category": self.category,
+            "genres": list(self.genres),
+            "presets": {name: list(presets) for name, presets in self.presets.items()},
+            "key_parameters": {name: dict(info) for name, info in self.key_parameters.items()},
+            "frequency_range": self.frequency_range,
+            "device_path": self.device_path
+        }
+
+
+Instrument._FIELDS = tuple(f.name for f in fields(Instrument))
+Instrument._FIELD_NAMES = frozenset(Instrument._FIELDS)
+
+
+def build_instruments(table: Dict[str, dict]) -> Mapping[str, Instrument]:
+    """Convert a name -> instrument dict table into a read-only table of Instrument records."""
+    return MappingProxyType({
+        name: Instrument(
+            description=info["description"],
+            category=info["category"],
+            genres=tuple(info["genres"]),
+            presets=MappingProxyType({
+                preset_type: tuple(presets) for preset_type, presets in info["presets"].items()
+            }),
+            key_parameters=ParamTable(info["key_parameters"]),
+            frequency_range=tuple(info["frequency_range"]),
+            device_path=info["device_path"]
+        )
+        for name, info in table.items()
+    })
@@ -5,7 +5,9 @@ Comprehensive database of Ableton Live Suite synthesizers with presets,
 parameters, and genre-specific recommendations.
 """
 
-SYNTHESIZERS = {
+from types import MappingProxyType
+
+SYNTHESIZERS = MappingProxyType({
     "Wavetable": {
         "description": "Advanced wavetable synthesizer with dual oscillators",
         "category": "synthesizer",
@@ -88,7 +90,7 @@ SYNTHESIZERS = {
         },
         "device_path": "Live/Collision"
     }
-}
+})
 
 # Synthesizer recommendations by mood and energy
 SYNTH_RECOMMENDATIONS = {
@@ -2,7 +2,6 @@
 Composition Handler - AI-powered music generation and arrangement
 """
 
-import asyncio
 import logging
 from typing import Dict, Any, List, Optional
 import random
@@ -140,8 +139,6 @@ This progression follows typical {genre} harmonic patterns with {'dark, industri
                     result = await self.ableton_tools.create_track(track_type, track_name)
                     if result["status"] == "success":
                         created_tracks.append(track_name)
-                        # Small delay to avoid overwhelming Ableton
-                        await asyncio.sleep(0.1)
                 except Exception as track_error:
                     logger.warning(f"Failed to create track {track_name}: {track_error}")
             
@@ -321,30 +321,16 @@ Use `load_effect` to add effects to tracks with automatic chain positioning."""
         logger.info(f"🔍 Getting effect parameters: track {track_id}, device {device_id}")
         
         try:
-            # Get parameter names via OSC
-            parameter_names = await self.ableton_tools.osc_client.send_and_wait(
-                "/live/device/get/parameters/name",
-                "/live/device/get/parameters/name",
-                track_id, device_id
-            )
+            # Get parameter names, values and device name via OSC in one round-trip
+            parameter_names, parameter_values, device_name = await self.ableton_tools.osc_client.gather_queries([
+                ("/live/device/get/parameters/name", "/live/device/get/parameters/name", track_id, device_id),
+                ("/live/device/get/parameters/value", "/live/device/get/parameters/value", track_id, device_id),
+                ("/live/device/get/name", "/live/device/get/name", track_id, device_id),
+            ])
             
             if not parameter_names:
                 return [{"type": "text", "text": f"❌ Could not retrieve parameters for effect on track {track_id}"}]
             
-            # Get parameter values
-            parameter_values = await self.ableton_tools.osc_client.send_and_wait(
-                "/live/device/get/parameters/value",
-                "/live/device/get/parameters/value",
-                track_id, device_id
-            )
-            
-            # Get device name
-            device_name = await self.ableton_tools.osc_client.send_and_wait(
-                "/live/device/get/name",
-                "/live/device/get/name",
-                track_id, device_id
-            )
-            
             # Combine names and values
             parameters = []
             for i, name in enumerate(parameter_names):
@@ -305,23 +305,15 @@ The {instrument_name} is loaded and ready. Use parameter control commands to adj
         logger.info(f"🔍 Getting parameters for instrument on track {track_id}, device {device_id}")
         
         try:
-            # Get parameter names via OSC
-            parameter_names = await self.ableton_tools.osc_client.send_and_wait(
-                "/live/device/get/parameters/name",
-                "/live/device/get/parameters/name",
-                track_id, device_id
-            )
+            # Get parameter names and values via OSC in one round-trip
+            parameter_names, parameter_values = await self.ableton_tools.osc_client.gather_queries([
+                ("/live/device/get/parameters/name", "/live/device/get/parameters/name", track_id, device_id),
+                ("/live/device/get/parameters/value", "/live/device/get/parameters/value", track_id, device_id),
+            ])
             
             if not parameter_names:
                 return [{"type": "text", "text": f"❌ Could not retrieve parameters for device on track {track_id}"}]
             
-            # Get parameter values
-            parameter_values = await self.ableton_tools.osc_client.send_and_wait(
-                "/live/device/get/parameters/value",
-                "/live/device/get/parameters/value", 
-                track_id, device_id
-            )
-            
             # Combine names and values
             parameters = []
             for i, name in enumerate(parameter_names):
@@ -451,8 +443,10 @@ The parameter has been updated and should be audible in your Ableton Live sessio
         try:
             # Get device name first
             try:
-                device_name = await self.ableton_tools.osc_client.get_device_name(track_id, device_id)
-                device_class = await self.ableton_tools.osc_client.get_device_class_name(track_id, device_id)
+                device_name, device_class = await asyncio.gather(
+                    self.ableton_tools.osc_client.get_device_name(track_id, device_id),
+                    self.ableton_tools.osc_client.get_device_class_name(track_id, device_id),
+                )
             except:
                 device_name = ["Unknown Device"]
                 device_class = ["Unknown"]
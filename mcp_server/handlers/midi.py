@@ -4,7 +4,6 @@ Provides comprehensive MIDI composition tools with scale-aware editing,
 music theory integration, and real-time parameter control.
 """
 
-import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 import random
@@ -123,6 +122,7 @@ The clip is ready for note input and will enforce the selected scale constraints
         
         try:
             added_notes = []
+            batch = []
             
             for note_data in notes_data:
                 pitch = note_data.get('pitch', 60)  # Middle C default
@@ -140,12 +140,7 @@ The clip is ready for note input and will enforce the selected scale constraints
                     logger.warning(f"Invalid velocity {velocity}, clamping to valid range")
                     velocity = max(1, min(127, velocity))
                 
-                # Add note via OSC
-                self.ableton_tools.osc_client.send(
-                    "/live/clip/add/notes",
-                    track_id, clip_id, pitch, start_time, duration, velocity, int(mute)
-                )
-                
+                batch.append((pitch, start_time, duration, velocity, mute))
                 added_notes.append({
                     'pitch': pitch,
                     'note_name': self._pitch_to_note_name(pitch),
@@ -154,9 +149,9 @@ The clip is ready for note input and will enforce the selected scale constraints
                     'velocity': velocity,
                     'mute': mute
                 })
-                
-                # Small delay to avoid overwhelming Ableton
-                await asyncio.sleep(0.01)
+            
+            # Add all notes via OSC in as few messages as possible
+            await self.ableton_tools.osc_client.add_notes_batch(track_id, clip_id, batch)
             
             response_text = f"""🎵 **Added {len(added_notes)} Notes Successfully**
 
@@ -52,6 +52,28 @@ class TrackHandler:
             logger.error(f"Error getting track count: {e}")
             return [{"type": "text", "text": f"❌ Error getting track count: {str(e)}"}]
     
+    async def list_tracks(self) -> List[Dict[str, Any]]:
+        """List every track's name and mute/solo state."""
+        logger.info("📋 Listing tracks")
+        
+        try:
+            # One track_data query covers every track instead of one query each
+            tracks = await self.ableton_tools.snapshot_tracks()
+            if not tracks:
+                return [{"type": "text", "text": "❌ Could not retrieve tracks"}]
+            
+            lines = [f"🎛️ {len(tracks)} tracks:"]
+            for i, track in enumerate(tracks):
+                flags = "".join(
+                    label for key, label in (("mute", " (muted)"), ("solo", " (solo)")) if track.get(key)
+                )
+                lines.append(f"  {i}: {track.get('name')}{flags}")
+            return [{"type": "text", "text": "\n".join(lines)}]
+                
+        except Exception as e:
+            logger.error(f"Error listing tracks: {e}")
+            return [{"type": "text", "text": f"❌ Error listing tracks: {str(e)}"}]
+    
     async def create_clip(self, track_idx: int, clip_slot_idx: int, length: float = 4.0) -> List[Dict[str, Any]]:
         """Create a new clip in the specified track and slot."""
         logger.info(f"🎵 Creating {length}-bar clip in track {track_idx}, slot {clip_slot_idx}")
@@ -147,6 +147,17 @@ async def create_track(track_type: str, name: Optional[str] = None) -> str:
     except Exception as e:
         return f"Error: {str(e)}"
 
+@mcp.tool()
+async def list_tracks() -> str:
+    """List every track in the Live set with its name and mute/solo state."""
+    try:
+        if not handlers:
+            return "Error: Server not initialized"
+        result = await handlers["track"].list_tracks()
+        return result[0]["text"] if result and "text" in result[0] else "No tracks found"
+    except Exception as e:
+        return f"Error: {str(e)}"
+
 # Composition Tools
 @mcp.tool()
 async def generate_chord_progression(key: str, genre: str, length: int = 8) -> str:
@@ -423,6 +434,12 @@ async def ensure_initialized_async():
 
 if __name__ == "__main__":
     print("🎵 AbletonMCP FastMCP starting up...", file=sys.stderr)
+    try:
+        # Use uvloop where available; FastMCP picks up the installed policy
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         # FastMCP handles the asyncio.run() internally
         mcp.run()
@@ -371,6 +371,12 @@ async def startup():
 # Main startup
 if __name__ == "__main__":
     print("🎵 AbletonMCP FastMCP starting up...", file=sys.stderr)
+    try:
+        # Use uvloop where available; FastMCP picks up the installed policy
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     try:
         # FastMCP handles the asyncio.run() internally
         mcp.run()
@@ -108,6 +108,11 @@ class AbletonTools:
         await self.ensure_connected()
         return await self.osc_client.get_track_count()
     
+    async def snapshot_tracks(self) -> List[Dict[str, Any]]:
+        """Get the name, mute and solo state of every track."""
+        await self.ensure_connected()
+        return await self.osc_client.snapshot_tracks()
+    
     # Clip Operations
     async def create_clip(self, track_idx: int, clip_slot_idx: int, length: float = 4.0) -> Dict[str, Any]:
         """Create a new clip."""
@@ -253,17 +258,15 @@ class AbletonTools:
         await self.ensure_connected()
         
         try:
-            for note in notes:
-                await self.osc_client.add_notes(
-                    track_idx, 
-                    clip_idx,
-                    note["pitch"],
-                    note["start_time"], 
-                    note["duration"],
-                    note["velocity"],
-                    note.get("mute", False)
-                )
-                
+            await self.osc_client.add_notes_batch(
+                track_idx,
+                clip_idx,
+                [
+                    (note["pitch"], note["start_time"], note["duration"], note["velocity"], note.get("mute", False))
+                    for note in notes
+                ]
+            )
+            
             return {
                 "status": "success",
                 "message": f"Added {len(notes)} MIDI notes to track {track_idx}, clip {clip_idx}",
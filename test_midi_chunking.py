@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test that large note batches are split into several /live/clip/add/notes messages
+Captures the client's datagrams on localhost, no Live needed
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from pythonosc.osc_message import OscMessage
+
+from ableton_control.osc_client.client import AbletonOSCClient, _NOTES_PER_MESSAGE
+
+
+def test_add_notes_batch_chunks_large_clips():
+    """A clip with more than _NOTES_PER_MESSAGE notes goes out in full-size chunks plus a remainder"""
+    notes = [(36 + i % 48, i * 0.25, 0.25, 64 + i % 64, i % 7 == 0) for i in range(2 * _NOTES_PER_MESSAGE + 44)]
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as capture:
+        capture.bind(("127.0.0.1", 0))
+        capture.settimeout(2.0)
+        client = AbletonOSCClient("127.0.0.1", send_port=capture.getsockname()[1])
+        asyncio.run(client.add_notes_batch(3, 1, notes))
+        messages = [OscMessage(capture.recv(65536)) for _ in range(3)]
+
+        # Nothing beyond the three chunks was sent
+        capture.settimeout(0.1)
+        try:
+            extra = capture.recv(65536)
+        except socket.timeout:
+            extra = None
+        assert extra is None
+
+    sent = []
+    for message in messages:
+        assert message.address == "/live/clip/add/notes"
+        assert message.params[:2] == [3, 1]
+        fields = message.params[2:]
+        assert len(fields) % 5 == 0
+        sent.append([tuple(fields[i:i + 5]) for i in range(0, len(fields), 5)])
+
+    assert [len(chunk) for chunk in sent] == [_NOTES_PER_MESSAGE, _NOTES_PER_MESSAGE, 44]
+    expected = [(pitch, start, length, velocity, int(mute)) for pitch, start, length, velocity, mute in notes]
+    assert [note for chunk in sent for note in chunk] == expected
+
+
+if __name__ == "__main__":
+    test_add_notes_batch_chunks_large_clips()
+    print("✅ Note batches are chunked correctly")
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Loopback tests for the batched sendmmsg/recvmmsg socket calls
+and the OSC client's per-datagram fallbacks, no Live needed
+"""
+
+import select
+import socket
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from ableton_control.osc_client import mmsg
+from ableton_control.osc_client.client import AbletonOSCClient
+
+
+def _udp_socket() -> socket.socket:
+    """A non-blocking UDP socket bound to an ephemeral localhost port."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    sock.setblocking(False)
+    return sock
+
+
+def _recv_all(sock: socket.socket, count: int):
+    """Read ``count`` datagrams, waiting up to 2 s for each."""
+    sock.settimeout(2.0)
+    try:
+        return [sock.recv(65536) for _ in range(count)]
+    finally:
+        sock.setblocking(False)
+
+
+def _assert_nothing_pending(sock: socket.socket):
+    try:
+        extra = sock.recv(65536)
+    except BlockingIOError:
+        extra = None
+    assert extra is None
+
+
+def test_sender_and_receiver_loopback():
+    """MMsgSender writes a batch that MMsgReceiver reads back in max_batch chunks"""
+    if mmsg._libc is None or not hasattr(mmsg._libc, "recvmmsg"):
+        raise unittest.SkipTest("sendmmsg/recvmmsg are Linux-only")
+
+    with _udp_socket() as receiving, _udp_socket() as sending:
+        sender = mmsg.create_sender(sending, receiving.getsockname(), max_batch=8)
+        receiver = mmsg.create_receiver(receiving, max_batch=4, datagram_size=2048)
+        assert isinstance(sender, mmsg.MMsgSender)
+        assert isinstance(receiver, mmsg.MMsgReceiver)
+
+        # Every datagram type the client hands over: bytes and pooled buffers
+        dgrams = [b"first", bytearray(b"second"), memoryview(bytearray(b"third" * 100))]
+        dgrams += [b"%d" % i for i in range(3)]
+        assert sender.send(dgrams) == len(dgrams)
+
+        select.select([receiving], [], [], 2.0)
+        first = receiver.recv()
+        second = receiver.recv()
+        assert first + second == [bytes(dgram) for dgram in dgrams]
+        assert len(first) == 4
+        assert receiver.recv() == []
+
+
+def test_sender_caps_batch_at_max_batch():
+    """send() writes at most max_batch datagrams and reports how many went out"""
+    if mmsg._libc is None:
+        raise unittest.SkipTest("sendmmsg is Linux-only")
+
+    with _udp_socket() as receiving, _udp_socket() as sending:
+        sender = mmsg.create_sender(sending, receiving.getsockname(), max_batch=2)
+        assert sender.send([b"a", b"b", b"c"]) == 2
+        assert _recv_all(receiving, 2) == [b"a", b"b"]
+        _assert_nothing_pending(receiving)
+
+
+def test_factories_return_none_without_mmsg():
+    """Where libc has no sendmmsg (e.g. macOS, Windows) both factories give None"""
+    with _udp_socket() as sock, mock.patch.object(mmsg, "_libc", None):
+        assert mmsg.create_sender(sock, ("127.0.0.1", 9), max_batch=8) is None
+        assert mmsg.create_receiver(sock, max_batch=8, datagram_size=2048) is None
+
+
+def test_client_sends_each_datagram_without_mmsg():
+    """Without sendmmsg the client writes a batch with one sendto per datagram"""
+    with _udp_socket() as receiving, mock.patch.object(mmsg, "_libc", None):
+        client = AbletonOSCClient("127.0.0.1", send_port=receiving.getsockname()[1])
+        assert client._mmsg is None
+        batch = [b"one", b"two", b"three"]
+        client._write_batch(batch)
+        assert _recv_all(receiving, 3) == batch
+        _assert_nothing_pending(receiving)
+
+
+class _RefusingSender:
+    """Stands in for an MMsgSender whose sendmmsg call accepts nothing"""
+
+    max_batch = 100
+
+    def __init__(self):
+        self.calls = 0
+
+    def send(self, dgrams):
+        self.calls += 1
+        return 0
+
+
+def test_write_batch_falls_back_when_sendmmsg_sends_nothing():
+    """A sendmmsg call that accepts no datagrams leaves the whole batch to sendto"""
+    with _udp_socket() as receiving:
+        client = AbletonOSCClient("127.0.0.1", send_port=receiving.getsockname()[1])
+        client._mmsg = _RefusingSender()
+        batch = [b"one", b"two", b"three"]
+        client._write_batch(batch)
+        assert client._mmsg.calls == 1
+        assert _recv_all(receiving, 3) == batch
+        _assert_nothing_pending(receiving)
+
+
+if __name__ == "__main__":
+    test_sender_and_receiver_loopback()
+    test_sender_caps_batch_at_max_batch()
+    test_factories_return_none_without_mmsg()
+    test_client_sends_each_datagram_without_mmsg()
+    test_write_batch_falls_back_when_sendmmsg_sends_nothing()
+    print("✅ All mmsg loopback tests passed")
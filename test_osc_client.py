@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Loopback tests for the OSC client's socket handling
+Runs against a fake AbletonOSC endpoint on localhost, no Live needed
+"""
+
+import asyncio
+import socket
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from pythonosc.osc_message import OscMessage
+
+from ableton_control.osc_client.client import AbletonOSCClient, _build_dgram
+
+
+def _free_port() -> int:
+    """Get a UDP port nothing is bound to on localhost."""
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class FakeLive(asyncio.DatagramProtocol):
+    """Answers tempo queries on the send port the way AbletonOSC does"""
+
+    def __init__(self, reply_port: int):
+        self.reply_port = reply_port
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        message = OscMessage(data)
+        if message.address == "/live/song/get/tempo":
+            self.transport.sendto(_build_dgram(message.address, 120.0), ("127.0.0.1", self.reply_port))
+
+
+async def check_connect_after_failed_connect():
+    """A connect that failed must not stop a later connect from receiving replies"""
+    loop = asyncio.get_running_loop()
+    send_port, receive_port = _free_port(), _free_port()
+    client = AbletonOSCClient("127.0.0.1", send_port, receive_port)
+    try:
+        # Nothing answers yet, so the connectivity check times out
+        assert not await client.connect()
+
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: FakeLive(receive_port), local_addr=("127.0.0.1", send_port)
+        )
+        try:
+            assert await client.connect()
+        finally:
+            transport.close()
+    finally:
+        client.disconnect()
+
+
+class CountingLive(FakeLive):
+    """Also answers track count queries with the number of such queries seen so far"""
+
+    def __init__(self, reply_port: int):
+        super().__init__(reply_port)
+        self.queries = 0
+
+    def datagram_received(self, data, addr):
+        message = OscMessage(data)
+        if message.address == "/live/song/get/num_tracks":
+            self.queries += 1
+            self.transport.sendto(_build_dgram(message.address, self.queries), ("127.0.0.1", self.reply_port))
+        else:
+            super().datagram_received(data, addr)
+
+
+async def check_concurrent_queries_get_replies_in_order():
+    """Concurrent queries on one address each get their own reply, first query first"""
+    loop = asyncio.get_running_loop()
+    send_port, receive_port = _free_port(), _free_port()
+    client = AbletonOSCClient("127.0.0.1", send_port, receive_port)
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: CountingLive(receive_port), local_addr=("127.0.0.1", send_port)
+    )
+    try:
+        assert await client.connect()
+        replies = await client.gather_queries(
+            [("/live/song/get/num_tracks", "/live/song/get/num_tracks")] * 3
+        )
+        assert replies == [(1,), (2,), (3,)]
+    finally:
+        transport.close()
+        client.disconnect()
+
+
+def test_connect_after_failed_connect():
+    asyncio.run(check_connect_after_failed_connect())
+
+
+def test_concurrent_queries_get_replies_in_order():
+    asyncio.run(check_concurrent_queries_get_replies_in_order())
+
+
+if __name__ == "__main__":
+    test_connect_after_failed_connect()
+    test_concurrent_queries_get_replies_in_order()
+    print("✅ All OSC client loopback tests passed")
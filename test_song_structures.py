@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test that genre song structures still behave like {section: bars} dicts
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent
+sys.path.insert(0, str(project_root))
+
+from knowledge_base.genres import section_range
+from knowledge_base.genres.drum_and_bass import DNB_SONG_STRUCTURES
+from knowledge_base.genres.dubstep import DUBSTEP_SONG_STRUCTURES
+from knowledge_base.genres.house import HOUSE_SONG_STRUCTURES, HOUSE_SONG_STRUCTURES_IDX
+from knowledge_base.genres.techno import SONG_STRUCTURES, SONG_STRUCTURES_IDX
+from knowledge_base.genres.trance import TRANCE_SONG_STRUCTURES, TRANCE_SONG_STRUCTURES_IDX
+
+
+def check_dict_behaviour(structure):
+    """A structure iterates, tests membership and sizes itself like the dict it replaced"""
+    names = [name for name, _ in structure.sections]
+    assert list(structure) == names
+    assert list(structure.keys()) == names
+    assert len(structure) == len(names)
+    assert names[0] in structure
+    assert "no_such_section" not in structure
+    assert structure.get("no_such_section") is None
+    assert dict(structure) == dict(structure.items())
+    assert sum(structure.values()) == structure.total_bars
+
+
+def test_dnb_and_dubstep_structures_are_mappings():
+    for table in (DNB_SONG_STRUCTURES, DUBSTEP_SONG_STRUCTURES):
+        for structure in table.values():
+            check_dict_behaviour(structure)
+
+    classic = DNB_SONG_STRUCTURES["classic"]
+    assert classic["drop"] == 64
+    assert classic.section_range("drop") == (64, 128)
+
+
+def test_house_techno_trance_tables_stay_dicts():
+    for table in (HOUSE_SONG_STRUCTURES, SONG_STRUCTURES, TRANCE_SONG_STRUCTURES):
+        for sections in table.values():
+            assert isinstance(sections, dict)
+            assert list(sections) == list(sections.keys())
+            assert "intro" in sections
+            assert len(sections) == len(list(sections.values()))
+
+
+def test_indexed_structures_match_the_dict_tables():
+    for table, index in (
+        (HOUSE_SONG_STRUCTURES, HOUSE_SONG_STRUCTURES_IDX),
+        (SONG_STRUCTURES, SONG_STRUCTURES_IDX),
+        (TRANCE_SONG_STRUCTURES, TRANCE_SONG_STRUCTURES_IDX),
+    ):
+        assert list(index) == list(table)
+        for name, sections in table.items():
+            structure = index[name]
+            check_dict_behaviour(structure)
+            assert dict(structure) == sections
+
+            # Each section starts where the previous one ended
+            bar = 0
+            for section, bars in sections.items():
+                assert section_range(structure, section) == (bar, bar + bars)
+                bar += bars
+            assert structure.total_bars == bar
+
+
+def test_section_lookup_is_read_only():
+    structure = DNB_SONG_STRUCTURES["classic"]
+    try:
+        structure._positions["intro"] = 3
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("section positions must not be writable")
+    assert structure.section_range("intro") == (0, 32)
+
+
+if __name__ == "__main__":
+    test_dnb_and_dubstep_structures_are_mappings()
+    test_house_techno_trance_tables_stay_dicts()
+    test_indexed_structures_match_the_dict_tables()
+    test_section_lookup_is_read_only()
+    print("✅ Song structures behave like read-only dicts")